@@ -9,33 +9,87 @@ bl_info = {
     "category": "Development"
 }
 
-import re, builtins
+import re, sys, os, time, heapq, struct, zlib
+from array import array
+from collections import OrderedDict, deque, Counter
+from itertools import chain
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Operator, Menu, Panel, PropertyGroup, AddonPreferences
-from bpy.props import IntProperty, StringProperty, BoolProperty,\
-    PointerProperty, CollectionProperty, BoolVectorProperty, IntVectorProperty
-
-try:  # if bpy.app.version < (3, 3, 0):
-    from console.complete_import import get_root_modules
-except ImportError:  # else:
-    from bl_console_utils.autocomplete.complete_import import get_root_modules
-
-
-# labels, icons(unused)
-CATEGORIES = (
-    ('Items', 'TRIA_DOWN'),
-    ('Values', 'TRIA_DOWN'),
-    ('Modules', 'PACKAGE'),
-    ('Types', 'WORDWRAP_ON'),
-    ('Properties', 'DOT'),
-    ('Structs and Functions', 'QUESTION'),
-    ('Methods and Functions', 'SCRIPT'),
-    ('Attributes', 'INFO'),
-    ('Inaccessible', 'ERROR'),
-)
+from bpy.props import IntProperty, StringProperty, BoolProperty, EnumProperty,\
+    PointerProperty, BoolVectorProperty, IntVectorProperty
+
+if not __package__:     # run from Blender's Text Editor
+    # import sibling modules as submodules of the add-on directory
+    _ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(_ADDON_DIR))
+    __package__ = os.path.basename(_ADDON_DIR)
+
+from .core import CATEGORIES, ITEMS, VALUES, MODULES, GenerationCache, CategorizeJob, \
+    cache_generation, bump_cache_generation, clear_caches, filter_categories, evaluate, \
+    parent, resolve_path, is_loaded, object_fingerprint, path_fingerprint, \
+    RootCategorizeJob, known_categories, tag_updated, FilteredView, compile_query
+from . import core
+
 
 _DATA_TREE = None
 
+# path -> TreeCacheEntry, least recently used first
+_TREE_CACHE = OrderedDict()
+
+# path -> HistoryEntry of visited paths, most recent last
+_HISTORY = OrderedDict()
+# path -> HistoryEntry of paths gone back from, next last
+_FORWARD = OrderedDict()
+
+# (category index, id(filtered category), start, end) -> (filtered category, cells)
+_PAGE_CACHE = GenerationCache(64)
+
+# seconds spent categorizing per timer tick
+CATEGORIZE_BUDGET = 0.005
+# seconds between fingerprint checks of a shown tree, catching changes
+# no depsgraph update reports, like attributes added to a module
+FINGERPRINT_INTERVAL = 0.5
+
+# paths likely to be opened next, categorized while idle
+_PREFETCH_QUEUE = deque()
+# path -> TreeCacheEntry prefetched but not opened yet, oldest first,
+# kept apart from _TREE_CACHE so it doesn't evict trees the user opened
+_PREFETCHED = OrderedDict()
+# (path, ids of visible page cells) the queue was built for
+_PREFETCH_KEY = None
+_PREFETCH_STATS = Counter()     # 'hits', 'misses'
+# most trees prefetched for a single view, and kept until opened
+PREFETCH_LIMIT = 16
+
+# Profiler while profiling is enabled
+_PROFILER = None
+# slowest getattr calls kept by the Profiler
+PROFILE_SLOWEST = 20
+
+# SymbolIndex of the whole API, built on first search
+_SYMBOL_INDEX = None
+
+# DocIndex over the symbols of the SymbolIndex, built on first doc search
+_DOC_INDEX = None
+
+# WorkerPool categorizing pure Python modules out of process, started on first use
+_WORKER_POOL = None
+
+# Snapshot of the current Blender version and add-ons, False if there is none
+_SNAPSHOT = None
+
+# (added, removed, changed) of the last API diff, entries are (path, old category, new category)
+_API_DIFF = None
+# (section index, filter text) -> FilteredView of matching diff entries, most recent last
+_DIFF_FILTERED = OrderedDict()
+# diff filter results kept, a few per section while typing
+DIFF_FILTER_RESULTS = 12
+DIFF_SECTIONS = ("Added", "Removed", "Changed")
+# enum items are referenced here, blender doesn't keep them alive
+_SNAPSHOT_ITEMS = []
+
+
 def get_props():
     return bpy.context.window_manager.api_props
 
@@ -52,6 +106,11 @@ def get_preferences():
             history_size = 10
             restore_history_settings = True
             auto_reload = True
+            cache_size = 32
+            scroll_rows = True
+            prefetch = True
+            remote_modules = False
+            remote_workers = 2
         return DummyPreference
 
 
@@ -61,14 +120,19 @@ def get_data_tree(update=False, reload=False):
     prefs = get_preferences()
 
     if _DATA_TREE == None or reload:
-       _DATA_TREE = categorize_module(api_props.path)
+        if reload:
+            invalidate_tree_cache(api_props.path)
+        _DATA_TREE = get_cached_tree(api_props.path)
     
     elif update:
         new_path = api_props.path
         old_path = api_props.old_path
         
+        if new_path != old_path:
+            record_prefetch_use(new_path)
+
         if prefs.auto_reload or new_path != old_path:
-            _DATA_TREE = categorize_module(new_path)
+            _DATA_TREE = get_cached_tree(new_path)
             update_history(new_path, old_path)
             api_props.old_path = new_path
     
@@ -76,223 +140,814 @@ def get_data_tree(update=False, reload=False):
     return filtered
 
 
+class TreeCacheEntry:
+    """Categorized tree of a path and the fingerprint it was built from"""
+    __slots__ = ('tree', 'fingerprint', 'generation', 'checked', 'job')
+
+    def __init__(self, tree, fingerprint, job=None):
+        self.tree = tree
+        self.fingerprint = fingerprint
+        self.generation = cache_generation()
+        self.checked = time.perf_counter()
+        self.job = job     # unfinished CategorizeJob or RemoteJob filling tree
+
+
+def get_cached_tree(path):
+    """Returns the categorized tree of path, categorizing only on cache miss
+    or when the object changed since it was cached"""
+
+    entry = _TREE_CACHE.get(path)
+    if entry is None:
+        # opening a prefetched tree, validated like any cached one
+        entry = _PREFETCHED.pop(path, None)
+        if entry is not None:
+            _TREE_CACHE[path] = entry
+            trim_tree_cache()
+            if entry.job:
+                start_categorize_timer()
+
+    if entry is not None:
+        _TREE_CACHE.move_to_end(path)
+        # no change reported and checked recently, or still categorizing
+        generation = cache_generation()
+        now = time.perf_counter()
+        if entry.job or (entry.generation == generation
+                         and now - entry.checked < FINGERPRINT_INTERVAL):
+            return entry.tree
+
+        fingerprint = tree_fingerprint(path)
+        if fingerprint == entry.fingerprint:
+            entry.generation = generation
+            entry.checked = now
+            return entry.tree
+
+    entry = _TREE_CACHE[path] = new_cache_entry(path, entry)
+    if entry.job:
+        start_categorize_timer()
+
+    trim_tree_cache()
+    return entry.tree
+
+
+def trim_tree_cache():
+    """Drops least recently used trees beyond cache size"""
+    extra = len(_TREE_CACHE) - get_preferences().cache_size
+    for _ in range(extra):
+        _TREE_CACHE.popitem(last=False)
+
+
+def new_cache_entry(path, previous=None):
+    """Returns a TreeCacheEntry of path, categorizing from the snapshot
+    or within the first time slice if possible, reusing categories of
+    members already in the previous entry of the same object"""
+
+    if not path:
+        job = RootCategorizeJob()
+        fingerprint = path_fingerprint(path)
+    elif is_remote(path):
+        from .remote import RemoteJob
+        job = RemoteJob(get_worker_pool(), path)
+        fingerprint = tree_fingerprint(path)
+    else:
+        module = evaluate(path)
+        tree = snapshot_tree(path, module)
+        if tree is not None:
+            return TreeCacheEntry(tree, object_fingerprint(module))
+
+        fingerprint = object_fingerprint(module)
+        known = None
+        if previous is not None:
+            known = known_categories(previous.tree, previous.fingerprint, fingerprint)
+        job = CategorizeJob(module, known)
+
+    # small objects finish within the first slice
+    job.step(CATEGORIZE_BUDGET)
+    return TreeCacheEntry(job.tree, fingerprint, None if job.done else job)
+
+
+def tree_fingerprint(path):
+    """Returns the fingerprint of path, without importing remote modules"""
+    if is_remote(path):
+        return 'REMOTE'
+    return path_fingerprint(path)
+
+
+def is_remote(path):
+    """Returns whether path is categorized out of process"""
+    if not path or not get_preferences().remote_modules:
+        return False
+    from .remote import is_remote_path
+    return is_remote_path(path)
+
+
+def get_worker_pool():
+    """Returns the WorkerPool, restarted if the worker count changed"""
+    global _WORKER_POOL
+    from .remote import WorkerPool
+
+    size = get_preferences().remote_workers
+    if _WORKER_POOL is not None and _WORKER_POOL.size != size:
+        _WORKER_POOL.shutdown()
+        _WORKER_POOL = None
+    if _WORKER_POOL is None:
+        _WORKER_POOL = WorkerPool(size)
+
+    return _WORKER_POOL
+
+
+def get_module_description(path):
+    if is_remote(path):
+        return get_worker_pool().description(path) or ""
+    return core.get_module_description(path)
+
+
+def get_object_info(path):
+    """Returns type, str and docstring texts of the object at path"""
+    if is_remote(path):
+        pool = get_worker_pool()
+        info = pool.infos.get(path)
+        if info is None:
+            # never import it here, that is what the worker is for
+            try:
+                if pool.collect(path) is None:
+                    return "Loading", f"{path} is being categorized out of process", "None"
+            except Exception as e:
+                return "Error", f"{type(e).__name__}: {e}", "Worker failed"
+            info = pool.infos[path]
+        if "error" in info:
+            return "Error", info["error"], "None"
+        return info["type"], info["str"], info["doc"] or "None"
+
+    obj = evaluate(path)
+    return str(type(obj)), str(obj), str(obj.__doc__)
+
+
+def get_numeric_previews(path):
+    """Returns NumericPreviews of array or collection data at path"""
+    if is_remote(path):
+        return []
+    from .preview import numeric_previews
+    return numeric_previews(evaluate(path))
+
+
+def schedule_prefetch(path, pages):
+    """Queues the parent, history and visible entries of path for prefetching"""
+    global _PREFETCH_KEY
+
+    key = (path, tuple(id(cells) for cells in pages))
+    if key == _PREFETCH_KEY or not get_preferences().prefetch:
+        return
+    _PREFETCH_KEY = key
+
+    candidates = [parent(path)] if path else []
+    candidates += reversed(_HISTORY)
+    # root modules would be imported by categorizing them
+    candidates += [resolve_path(path, info) for cells in pages for _, info in cells
+                   if path or not info.startswith(f"{MODULES} ")]
+
+    _PREFETCH_QUEUE.clear()
+    for candidate in dict.fromkeys(candidates):
+        prefetched = _PREFETCHED.get(candidate)
+        # never import modules or call RNA getters in background
+        if candidate != path and candidate not in _TREE_CACHE \
+                and (prefetched is None or prefetched.job) \
+                and is_loaded(candidate) and not is_rna_member(candidate):
+            _PREFETCH_QUEUE.append(candidate)
+            if len(_PREFETCH_QUEUE) >= PREFETCH_LIMIT:
+                break
+
+    if _PREFETCH_QUEUE and not bpy.app.timers.is_registered(prefetch_timer):
+        bpy.app.timers.register(prefetch_timer, first_interval=0.1)
+
+
+def is_rna_member(path):
+    """Returns whether path may be a member of a bpy_struct by the cached
+    tree of its parent, evaluating it could call a property getter"""
+    owner = parent(path)
+    entry = _TREE_CACHE.get(owner) or _PREFETCHED.get(owner)
+    if entry is None:
+        return bool(owner)  # root members aren't RNA
+    return isinstance(entry.tree.source, core.bpy_struct_type())
+
+
+def prefetch_timer():
+    """Categorizes queued paths while no categorize job is running,
+    a big path continues in the next tick where it stopped"""
+
+    if any(entry.job for entry in _TREE_CACHE.values()):
+        return 0.1  # not idle
+
+    deadline = time.perf_counter() + CATEGORIZE_BUDGET
+
+    while _PREFETCH_QUEUE and time.perf_counter() < deadline:
+        path = _PREFETCH_QUEUE[0]
+        entry = _PREFETCHED.get(path)
+        if path in _TREE_CACHE or (entry is not None and not entry.job):
+            _PREFETCH_QUEUE.popleft()
+            continue
+
+        if entry is None:
+            entry = new_cache_entry(path)
+            # prefetches of earlier views go first
+            _PREFETCHED[path] = entry
+            extra = len(_PREFETCHED) - PREFETCH_LIMIT
+            for _ in range(extra):
+                _PREFETCHED.popitem(last=False)
+
+        # stepped within this tick, prefetching shouldn't keep the categorize timer busy
+        if entry.job:
+            entry.job.step(max(deadline - time.perf_counter(), 0))
+            if not entry.job.done:
+                break
+            entry.job = None
+        _PREFETCH_QUEUE.popleft()
+
+    return 0.05 if _PREFETCH_QUEUE else None
+
+
+def record_prefetch_use(path):
+    """Counts whether navigating to path was served by the prefetcher"""
+    if path in _TREE_CACHE:
+        return
+    if path in _PREFETCHED:
+        _PREFETCH_STATS['hits'] += 1
+    else:
+        _PREFETCH_STATS['misses'] += 1
+
+
+def get_tree_progress(path):
+    """Returns (categorized, total) member counts if path is still categorizing"""
+    entry = _TREE_CACHE.get(path)
+    if entry is not None and entry.job:
+        return entry.job.index, len(entry.job.words)
+
+
+def get_tree_error(path):
+    """Returns the error categorizing path, if any"""
+    entry = _TREE_CACHE.get(path)
+    if entry is not None:
+        return entry.tree.error
+
+
+def invalidate_tree_cache(path=None):
+    """Drops cached tree of path or every cached tree if path is None"""
+    clear_caches()
+    _PAGE_CACHE.clear()
+
+    if path is None:
+        _TREE_CACHE.clear()
+        _PREFETCHED.clear()
+        for hist in chain(_HISTORY.values(), _FORWARD.values()):
+            hist.cached = None
+    else:
+        _TREE_CACHE.pop(path, None)
+        _PREFETCHED.pop(path, None)
+        for hist in (_HISTORY.get(path), _FORWARD.get(path)):
+            if hist is not None:
+                hist.cached = None
+
+
+def categorize_timer():
+    """Advances unfinished categorize jobs, current path first"""
+
+    deadline = time.perf_counter() + CATEGORIZE_BUDGET
+    current = _TREE_CACHE.get(get_props().path)
+
+    entries = [e for e in reversed(_TREE_CACHE.values()) if e.job]
+    if current in entries:
+        entries.remove(current)
+        entries.insert(0, current)
+
+    for entry in entries:
+        if time.perf_counter() >= deadline:
+            break
+        entry.job.step(deadline - time.perf_counter())
+        if entry.job.done:
+            entry.job = None
+
+    tag_redraw()
+
+    if any(entry.job for entry in _TREE_CACHE.values()):
+        return 0.01
+    return None
+
+
+def start_categorize_timer():
+    if not bpy.app.timers.is_registered(categorize_timer):
+        bpy.app.timers.register(categorize_timer)
+
+
+def stop_categorize_timer():
+    if bpy.app.timers.is_registered(categorize_timer):
+        bpy.app.timers.unregister(categorize_timer)
+
+
+def tag_redraw():
+    """Redraws Text Editors where the panel lives"""
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'TEXT_EDITOR':
+                    area.tag_redraw()
+    except AttributeError:
+        pass
+
+
+def mark_tree_cache_dirty():
+    """Forces cached trees to be revalidated on next access"""
+    bump_cache_generation()
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph=None):
+    # updated datablocks change fingerprint, ID.is_updated is gone since 2.80
+    if depsgraph is not None:
+        for update in depsgraph.updates:
+            tag_updated(update.id.original.as_pointer())
+    mark_tree_cache_dirty()
+
+
+@persistent
+def on_data_reset(*args):
+    # objects of the previous file or undo step are gone
+    invalidate_tree_cache()
+    mark_tree_cache_dirty()
+
+
 def filter_tree(tree):
 
     api_props = get_props()
 
-    filter_text = api_props.filter.lower()
+    filter_text = api_props.filter
     filter_internal = api_props.filter_internal
 
-    tree = ([(idx, mod) for idx, mod in enumerate(cat)] for cat in tree)
+    return filter_categories(tree, filter_text, filter_internal)
 
-    if filter_internal:
-        tree = ([(idx, mod) for idx, mod in cat if not mod.startswith('_')]
-                for cat in tree)
 
-    if filter_text:
-        tree = ([(idx, mod) for idx, mod in cat if filter_text in mod.lower()]
-                for cat in tree)
-    
-    return list(tree)
+def get_page_cells(cat_index, category, start, end, format_cell=None):
+    """Returns (text, info) of filtered category entries from start to end,
+    formatted once per page, by format_cell(entry) if given"""
 
+    key = (cat_index, id(category), start, end)
+    cached = _PAGE_CACHE.lookup(key)
+    if cached is not None and cached[0] is category:
+        return cached[1]
 
-def update_history(new_path, old_path):
+    if format_cell is None:
+        cells = [(str(entry), f'{cat_index} {idx} {entry}')
+                 for idx, entry in category[start:end]]
+    else:
+        cells = [format_cell(entry) for _, entry in category[start:end]]
 
-    # in case of reload don't change history
-    if new_path == old_path:
+    _PAGE_CACHE.store(key, (category, cells))
+    return cells
+
+
+def page_bounds(page_indices, i, size, rows, columns):
+    """Returns (start, end) of the page of size entries page_indices[i] shows,
+    clamping the page index"""
+
+    count = rows * columns
+    page_index = page_indices[i]
+    if get_preferences().scroll_rows:
+        # page index is the first visible row
+        last_row = -(size // -columns) - rows + 1 # ceil div
+        page_index = min(page_index, max(last_row, 1))
+        start = (page_index -1) * columns
+    else:
+        page_index = max(min(page_index, -(size // -count)), 1) # ceil div
+        start = (page_index -1) * count
+    page_indices[i] = page_index
+
+    return start, min(start+count, size)
+
+
+#########################################################################################
+# HISTORY
+#########################################################################################
+
+class HistoryEntry:
+    """Filter, toggles and pages of a visited path, and its categorized tree
+    retained so going back is instant"""
+    __slots__ = ('filter', 'category_toggles', 'page_indices', 'cached')
+
+    def __init__(self, path):
+        api_props = get_props()
+        self.filter = api_props.filter
+        self.category_toggles = tuple(api_props.category_toggles)
+        self.page_indices = tuple(api_props.page_indices)
+        self.cached = _TREE_CACHE.get(path)
+
+    def restore(self, path, settings=True):
+        """Puts the retained tree back in the tree cache, revalidated on access,
+        and restores view settings"""
+
+        if self.cached is not None and path not in _TREE_CACHE:
+            _TREE_CACHE[path] = self.cached
+            trim_tree_cache()
+            if self.cached.job:
+                start_categorize_timer()
+
+        if settings:
+            api_props = get_props()
+            api_props.filter = self.filter
+            api_props.category_toggles = self.category_toggles
+            api_props.page_indices = self.page_indices
+
+
+def push_history(stack, path):
+    """Records path with its current view on top of stack, dropping
+    the oldest entries beyond history size"""
+    if not path:    # don't add empty path
         return
-    
-    prefs = get_preferences()
-    api_props = get_props()
-    history = api_props.history
 
-    if old_path:    # don't add empty path
-        # add to history
-        hist = history.add()
-        hist.name = hist.path = old_path
-        
-        hist.filter = api_props.filter
-        hist.category_toggles = api_props.category_toggles
-        hist.page_indices = api_props.page_indices
+    stack.pop(path, None)
+    stack[path] = HistoryEntry(path)
+
+    extra = len(stack) - get_preferences().history_size
+    for _ in range(extra):
+        stack.popitem(last=False)
+
+
+def open_history(path):
+    """Resets view settings for path, restoring them and its tree
+    if path was visited"""
 
-    # reset props
+    api_props = get_props()
     api_props.filter = ""
     api_props.category_toggles = (True,) * len(CATEGORIES)
     api_props.page_indices = (1,) * len(CATEGORIES)
 
-    if new_path:
-        # check if exists in history
-        idx = history.find(new_path)
-        if idx != -1:
-            hist = history[idx]
+    hist = _HISTORY.pop(path, None)
+    hist = _FORWARD.pop(path, None) or hist
+    if hist is not None:
+        hist.restore(path, get_preferences().restore_history_settings)
+
+
+def update_history(new_path, old_path):
+
+    # in case of reload don't change history
+    if new_path == old_path:
+        return
 
-            if prefs.restore_history_settings:
-                # copy props from history
-                api_props.filter = hist.filter
-                api_props.category_toggles = hist.category_toggles
-                api_props.page_indices = hist.page_indices
+    push_history(_HISTORY, old_path)
+    # a new path starts a new branch
+    _FORWARD.clear()
+    open_history(new_path)
 
-            # remove
-            history.remove(idx)
 
-    # remove extras
-    extra = len(history) - prefs.history_size
-    for i in range(extra):
-        history.remove(i)
+def navigate_history(forward=False):
+    """Goes back to the most recent history path, or forward to the next
+    path gone back from"""
+    global _DATA_TREE
 
+    source, target = (_FORWARD, _HISTORY) if forward else (_HISTORY, _FORWARD)
+    if not source:
+        return
+
+    api_props = get_props()
+    path = next(reversed(source))
+    push_history(target, api_props.path)
+    open_history(path)
+
+    record_prefetch_use(path)
+    api_props.path = api_props.old_path = path
+    _DATA_TREE = get_cached_tree(path)
+
+
+def clear_history():
+    _HISTORY.clear()
+    _FORWARD.clear()
 
 
 #########################################################################################
-# UTILITY FUNCTIONS
+# SYMBOL INDEX
 #########################################################################################
 
-def evaluate(path):
-    """Returns Python Object from String Path"""
-    try:
-        parts = re.split('([^a-zA-Z0-9_-])', path.strip(), 1) # '-' for 'API_Browser-main'
-        if parts[0] in dir(builtins):
-            namespace = {}
-        else:
-            try:
-                # replace parts[0] with 'mod' incase of illegal mod-name
-                # eg. '-' in 'API_Browser-main'
-                namespace = {'mod': __import__(parts[0])}
-                parts[0] = 'mod'
-            except:
-                namespace = {}
-        
-        return  eval("".join(parts), namespace)
-    except Exception as e:
-        return e
+def get_symbol_index():
+    """Returns the SymbolIndex, starting to build it in background if needed"""
+    global _SYMBOL_INDEX
+    from .search import SymbolIndex
 
+    if _SYMBOL_INDEX is None:
+        snapshot = get_snapshot()
+        _SYMBOL_INDEX = snapshot.symbol_index() if snapshot else SymbolIndex()
 
-def parent(path):
-    """Returns the parent path"""
-    # TODO: fix ['" characters in key
-    return path.rpartition('[' if path.endswith(']') else '.')[0]   # rsplit() not used
+    if not _SYMBOL_INDEX.done and not bpy.app.timers.is_registered(symbol_index_timer):
+        bpy.app.timers.register(symbol_index_timer)
 
+    return _SYMBOL_INDEX
 
-def resolve_path(path, info):
-    """Returns Submodule path from info=(cat, idx, word) tuple"""
 
-    cat, idx, word = info.split(" ", maxsplit=2)
-    cat = int(cat)
+def symbol_index_timer():
+    if _SYMBOL_INDEX is None:
+        return None
 
-    if cat == 0:  # key
-        key = word
-        # escape \' characters
-        key = key.replace("\\", "\\\\").replace("'", "\\'")
-        path += f"['{key}']"
+    _SYMBOL_INDEX.step(CATEGORIZE_BUDGET)
+    tag_redraw()
 
-    elif cat == 1:  # index
-        path += f"[{idx}]"
+    if _SYMBOL_INDEX.done:
+        save_snapshot()
+        return None
+    return 0.01
 
-    else:
-        if path:
-            path += '.'
-        path += word
 
-    return path
+def get_doc_index():
+    """Returns the DocIndex, starting to build it in background if needed"""
+    global _DOC_INDEX
+    from .search import DocIndex
 
+    symbols = get_symbol_index()
+    if _DOC_INDEX is None or _DOC_INDEX.symbols is not symbols:
+        _DOC_INDEX = DocIndex(symbols)
 
-def get_module_description(path):
-    module = evaluate(path)
-    desc = str(module)
+    if not _DOC_INDEX.done and not bpy.app.timers.is_registered(doc_index_timer):
+        bpy.app.timers.register(doc_index_timer)
 
-    if module.__doc__:
-        # omit last '.'; blender adds an '.' after
-        desc += "\n\n" + str(module.__doc__).rstrip(" .")
+    return _DOC_INDEX
 
-    return desc
 
+def doc_index_timer():
+    if _DOC_INDEX is None:
+        return None
 
-def isiterable(mod):
-    try:
-        # (str, byte) can be passed but bpy.app gets ignored
-        return iter(mod) and not isinstance(mod, str)
-    except:
-        return False
+    # wait for symbols to be crawled first
+    if not _DOC_INDEX.symbols.done:
+        return 0.1
+
+    _DOC_INDEX.step(CATEGORIZE_BUDGET)
+    tag_redraw()
+
+    return None if _DOC_INDEX.done else 0.01
 
 
-# following functions are taken from rlcompleter.py and modified
+#########################################################################################
+# PROFILING
+#########################################################################################
 
-def get_class_members(klass):
-    ret = dir(klass)
-    if hasattr(klass,'__bases__'):
-        for base in klass.__bases__:
-            ret = ret + get_class_members(base)
-    return ret
+class Profiler:
+    """Per phase timings and slowest getattr calls of hot paths,
+    instrumented functions are only swapped in while installed"""
+
+    def __init__(self):
+        self.phases = {}    # phase -> [calls, total seconds, max seconds]
+        self.slowest = []   # min heap of (seconds, member)
+        self.originals = []  # (owner, name, original)
+
+    def add(self, phase, seconds):
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+    def add_member(self, member, seconds):
+        if len(self.slowest) < PROFILE_SLOWEST:
+            heapq.heappush(self.slowest, (seconds, member))
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, member))
+
+    def timed(self, phase, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(phase, time.perf_counter() - start)
+        return wrapper
+
+    def timed_getattr(self):
+        """Stand-in of builtin getattr, recording the slowest members"""
+        def wrapper(obj, name, *default):
+            start = time.perf_counter()
+            try:
+                return getattr(obj, name, *default)
+            finally:
+                self.add_member(f"{type(obj).__name__}.{name}", time.perf_counter() - start)
+        return wrapper
+
+    def swap(self, owner, name, replacement):
+        # None for names only found in builtins, deleted again on uninstall
+        self.originals.append((owner, name, owner.__dict__.get(name)))
+        setattr(owner, name, replacement)
+
+    def install(self):
+        from . import search, remote
+        module = sys.modules[__name__]
+        # evaluate is imported by name, swapped wherever it's called from
+        for owner in (module, core, search):
+            self.swap(owner, 'evaluate', self.timed('evaluate', owner.evaluate))
+        self.swap(module, 'filter_tree', self.timed('filter', filter_tree))
+        for phase, job in (('categorize', CategorizeJob), ('root', RootCategorizeJob),
+                           ('remote', remote.RemoteJob)):
+            self.swap(job, 'step', self.timed(phase, job.step))
+        # shadows the builtin for core only, CategorizeJob.step calls it per member
+        self.swap(core, 'getattr', self.timed_getattr())
+        self.swap(API_PT_Browser, 'draw', self.timed('draw', API_PT_Browser.draw))
+
+    def uninstall(self):
+        for owner, name, original in reversed(self.originals):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self.originals.clear()
+
+    def report(self):
+        lines = ["API Browser Performance", ""]
+        lines.append(f"{'Phase':<12}{'Calls':>8}{'Total ms':>12}{'Avg ms':>10}{'Max ms':>10}")
+        for phase, (calls, total, longest) in sorted(self.phases.items()):
+            lines.append(f"{phase:<12}{calls:>8}{total * 1e3:>12.2f}"
+                         f"{total / calls * 1e3:>10.3f}{longest * 1e3:>10.3f}")
+
+        lines += ["", "Slowest members (ms):"]
+        for seconds, member in sorted(self.slowest, reverse=True):
+            lines.append(f"{seconds * 1e3:>10.3f}  {member}")
+
+        lines += ["", "Prefetch: {} hits, {} misses".format(
+            _PREFETCH_STATS['hits'], _PREFETCH_STATS['misses'])]
+        return "\n".join(lines)
+
+
+def update_profiling(self, context):
+    """Installs or removes the Profiler when the profile toggle changes"""
+    global _PROFILER
+
+    if self.profile and _PROFILER is None:
+        _PROFILER = Profiler()
+        _PROFILER.install()
+    elif not self.profile and _PROFILER is not None:
+        _PROFILER.uninstall()
+        _PROFILER = None
 
 
-def object_categories(obj):
-    
-    itm, val, mod, typ, props, struct, met, att, bug = [], [], [], [], [], [], [], [], []
+#########################################################################################
+# SNAPSHOT
+#########################################################################################
 
-    if isiterable(obj):
-        if hasattr(obj, 'keys') \
-            and len(obj) == len(obj.keys()): # special check for <class 'bpy_prop_collection'>
-            itm = [str(k) for k in obj.keys()]
-        else:
-            val = [str(v) for v in obj]
+def snapshot_key():
+    """Returns file name of the snapshot for the running Blender and add-ons"""
+    addons = ",".join(sorted(bpy.context.preferences.addons.keys()))
+    version = "_".join(str(v) for v in bpy.app.version)
+    return f"api_snapshot_{version}_{zlib.crc32(addons.encode()):08x}.bin"
 
-    words = set(dir(obj))
-    if hasattr(obj, '__class__'):
-        words.add('__class__')
-        words.update(get_class_members(obj.__class__))
-    
-    for word in sorted(words):
+
+def snapshot_dir():
+    return bpy.utils.user_resource('CONFIG', path="api_browser", create=True)
+
+
+def get_snapshot():
+    """Returns the Snapshot for the running Blender and add-ons, None if missing"""
+    global _SNAPSHOT
+    from .snapshot import Snapshot
+
+    if _SNAPSHOT is None:
         try:
-            styp = str(type(getattr(obj, word)))
-        except:
-            bug.append( word )
-            continue
+            _SNAPSHOT = Snapshot(os.path.join(snapshot_dir(), snapshot_key()))
+        except (OSError, ValueError, struct.error):
+            _SNAPSHOT = False
 
-        if styp == "<class 'module'>":
-            mod.append( word )
-        elif styp.startswith("<class 'bpy_prop"):
-            props.append( word )
-        elif styp.startswith("<class 'bpy"):
-            struct.append( word )
-        elif styp == "<class 'builtin_function_or_method'>":
-            met.append( word )
-        elif styp == "<class 'type'>":
-            typ.append( word )
-        else:
-            att.append( word )
+    return _SNAPSHOT or None
 
-    return itm, val, mod, typ, props, struct, met, att, bug
-    
 
-def global_categories():
+def snapshot_tree(path, obj):
+    """Returns tree of path from the snapshot if obj still has the same members"""
+    snapshot = get_snapshot()
+    if not snapshot:
+        return None
 
-    itm, val, mod, typ, props, struct, met, att, bug = [], [], [], [], [], [], [], [], []
-    mod += get_root_modules()
+    from .snapshot import is_static, members_crc
+    if not is_static(obj):
+        return None
 
-    for word, value in builtins.__dict__.items():
-        try:
-            styp = str(type(value))
-        except:
-            bug.append( word )
-            continue
+    cached = snapshot.tree(path)
+    if cached is None or cached[0] != members_crc(obj):
+        return None
+    cached[1].source = obj
+    return cached[1]
 
-        if styp == "<class 'type'>":
-            typ.append( word )
-        elif styp == "<class 'builtin_function_or_method'>":
-            met.append( word )
-        else:
-            att.append( word )
-    
-    return itm, val, mod, typ, props, struct, met, att, bug
 
+def list_snapshots():
+    """Returns (file name, label) of snapshots on disk, newest version first"""
+    try:
+        names = os.listdir(snapshot_dir())
+    except OSError:
+        return []
 
-def categorize_module(path):
-    
-    if not path:
-        return global_categories()
+    snapshots = []
+    for name in names:
+        match = re.fullmatch(r"api_snapshot_([0-9_]+)_([0-9a-f]{8})\.bin", name)
+        if match:
+            version = tuple(int(v) for v in match.group(1).split("_"))
+            label = ".".join(match.group(1).split("_")) + f" (add-ons {match.group(2)})"
+            snapshots.append((version, name, label))
+
+    return [(name, label) for _, name, label in sorted(snapshots, reverse=True)]
+
+
+def snapshot_items(self, context):
+    _SNAPSHOT_ITEMS[:] = [('LIVE', "Live", "Symbols of the running Blender")]
+    _SNAPSHOT_ITEMS.extend((name, label, name) for name, label in list_snapshots())
+    return _SNAPSHOT_ITEMS
+
+
+def load_symbol_categories(key):
+    """Returns {path: category index} of a snapshot file name or 'LIVE',
+    None while the live API is still being indexed"""
+
+    if key == 'LIVE':
+        index = get_symbol_index()
+        if not index.done:
+            return None
+        return dict(zip(index.paths, index.categories))
+
+    from .snapshot import Snapshot
+    snapshot = Snapshot(os.path.join(snapshot_dir(), key))
+    try:
+        strings = snapshot.strings
+        return {strings[p]: cat for p, cat in zip(snapshot.path_ids, snapshot.categories)}
+    finally:
+        snapshot.close()
+
+
+def filter_diff(section, filter_text):
+    """Returns FilteredView of the entries of a diff section matching the
+    filter query, cat: terms test the new category, or the old one if removed;
+    type: terms are ignored, entries have no values"""
+    key = (section, filter_text)
+    result = _DIFF_FILTERED.get(key)
+    if result is not None:
+        _DIFF_FILTERED.move_to_end(key)
+        return result
+
+    entries = _API_DIFF[section]
+    query = compile_query(filter_text)
+    ids = range(len(entries))
+    if query:
+        categories = query.categories
+        match_name = query.match_name
+        ids = array('I', (i for i, (path, old_cat, new_cat) in enumerate(entries)
+                          if (old_cat if new_cat is None else new_cat) in categories
+                          and match_name(path, path.lower())))
+
+    result = _DIFF_FILTERED[key] = FilteredView(entries, ids)
+    while len(_DIFF_FILTERED) > DIFF_FILTER_RESULTS:
+        _DIFF_FILTERED.popitem(last=False)
+    return result
+
+
+def diff_cell(entry):
+    """Returns (text, path to go to) of a diff entry, no path if removed"""
+    path, old_cat, new_cat = entry
+    if new_cat is None:
+        return path, ""
+    if old_cat is not None:
+        return f"{path}  ({CATEGORIES[old_cat][0]} > {CATEGORIES[new_cat][0]})", path
+    return path, path
+
+
+def save_snapshot():
+    """Writes the symbol index and categorized trees of static paths to disk"""
+    global _SNAPSHOT, _SYMBOL_INDEX
+    from .search import SymbolIndex
+    from .snapshot import is_static, members_crc, write_snapshot
+
+    index = _SYMBOL_INDEX
+    snapshot = get_snapshot()
+    if index is None or not index.done:
+        if not snapshot:
+            return
+        index = snapshot.symbol_index()
+
+    trees = {}
+    if snapshot:
+        for path in snapshot.trees:
+            trees[path] = snapshot.tree(path)
 
-    module = evaluate(path)
+    for path, entry in _TREE_CACHE.items():
+        obj = evaluate(path) if path and not entry.job and not is_remote(path) else None
+        if obj is None or not is_static(obj) or len(entry.tree[ITEMS]) or len(entry.tree[VALUES]):
+            continue
+        trees[path] = (members_crc(obj), entry.tree)
+
+    # materialize lazily decoded strings before the mapping goes away
+    index.update_lookup()
+    names, paths = list(index.names), list(index.paths)
+    index = SymbolIndex.from_tables(names, paths, array('B', index.categories),
+                                    index.joined, array('I', index.offsets),
+                                    array('I', index.sorted_ids))
+    if _SYMBOL_INDEX is not None and _SYMBOL_INDEX.done:
+        _SYMBOL_INDEX = index
+
+    if snapshot:
+        snapshot.close()
+    _SNAPSHOT = None
 
-    return object_categories(module)
+    try:
+        write_snapshot(os.path.join(snapshot_dir(), snapshot_key()), index, trees)
+    except OSError:
+        pass
 
 
 #########################################################################################
@@ -307,8 +962,7 @@ class API_OT_History_Clear(Operator):
 
     def execute(self, context):
 
-        api_props = get_props()
-        api_props.history.clear()
+        clear_history()
 
         self.report({"INFO"}, "History Cleared!")
         return {'FINISHED'}
@@ -319,13 +973,10 @@ class API_MT_History_Menu(Menu):
 
     def draw(self, context):
         
-        api_props = get_props()
-        history = api_props.history
         layout = self.layout
 
-        for i in range(len(history) - 1, -1, -1):
-            item = history[i]
-            layout.operator(API_OT_History.bl_idname, text=item.path).index = i
+        for path in reversed(_HISTORY):
+            layout.operator(API_OT_History.bl_idname, text=path).path = path
         layout.separator()
         layout.operator(API_OT_History_Clear.bl_idname, text="Clear", icon="CANCEL")
 
@@ -335,37 +986,72 @@ class API_OT_History(Operator, Menu):
     bl_label = "History"
     bl_idname = "api_browser.history"
 
-    index: IntProperty(name="index", default=-1)
+    path: StringProperty(name="path", default="")
 
     @classmethod
     def description(cls, context, properties):
 
-        api_props = get_props()
-        idx = properties.index
-
-        if idx == -1:
-            return
-        
-        path = api_props.history[idx].path
+        path = properties.path
 
         if path:
             return get_module_description(path)
 
     @classmethod
     def poll(cls, context):
-        return get_props().history
+        return bool(_HISTORY)
 
     def execute(self, context):
 
         api_props = get_props()
-        idx = self.index
+        path = self.path
 
-        if idx == -1:
+        if not path:
             bpy.ops.wm.call_menu(name=API_MT_History_Menu.bl_idname)
         else:
-            hist = api_props.history[idx]
-            api_props.path = hist.path
-            self.index = -1
+            api_props.path = path
+            self.path = ""
+
+        return {'FINISHED'}
+
+
+class API_OT_History_Back(Operator):
+    """Go Back"""
+    bl_idname = "api_browser.history_back"
+    bl_label = "Back"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_HISTORY)
+
+    @classmethod
+    def description(cls, context, properties):
+        if _HISTORY:
+            return get_module_description(next(reversed(_HISTORY)))
+
+    def execute(self, context):
+
+        navigate_history()
+
+        return {'FINISHED'}
+
+
+class API_OT_History_Forward(Operator):
+    """Go Forward"""
+    bl_idname = "api_browser.history_forward"
+    bl_label = "Forward"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_FORWARD)
+
+    @classmethod
+    def description(cls, context, properties):
+        if _FORWARD:
+            return get_module_description(next(reversed(_FORWARD)))
+
+    def execute(self, context):
+
+        navigate_history(forward=True)
 
         return {'FINISHED'}
 
@@ -441,6 +1127,26 @@ class API_OT_GOTO_Sub_Module(Operator):
         return {'FINISHED'}
 
 
+class API_OT_GOTO_Path(Operator):
+    """Go to Path"""
+    bl_idname = "api_browser.goto_path"
+    bl_label = "Go To Path"
+
+    path: StringProperty(name="path", default="")
+
+    @classmethod
+    def description(cls, context, properties):
+        if properties.path:
+            return get_module_description(properties.path)
+
+    def execute(self, context):
+
+        api_props = get_props()
+        api_props.path = self.path
+
+        return {'FINISHED'}
+
+
 class API_OT_Reload_Module(Operator):
     """Reloads the Current module"""
     bl_idname = "api_browser.reload"
@@ -454,6 +1160,70 @@ class API_OT_Reload_Module(Operator):
         return {'FINISHED'}
 
 
+class API_OT_Diff(Operator):
+    """Compares symbols of two API snapshots"""
+    bl_idname = "api_browser.diff"
+    bl_label = "Compare"
+
+    def execute(self, context):
+        global _API_DIFF
+
+        api_props = get_props()
+
+        try:
+            old = load_symbol_categories(api_props.diff_old)
+            new = load_symbol_categories(api_props.diff_new)
+        except (OSError, ValueError, struct.error) as e:
+            self.report({"ERROR"}, f"Can't read snapshot: {e}")
+            return {'CANCELLED'}
+
+        if old is None or new is None:
+            self.report({"WARNING"}, "API is still being indexed!")
+            return {'CANCELLED'}
+
+        from .snapshot import diff_symbols
+        _API_DIFF = diff_symbols(old, new)
+        _DIFF_FILTERED.clear()
+
+        self.report({"INFO"}, "{} Added, {} Removed, {} Changed".format(*map(len, _API_DIFF)))
+        return {'FINISHED'}
+
+
+class API_OT_Profile_Report(Operator):
+    """Writes the performance report to a Text datablock"""
+    bl_idname = "api_browser.profile_report"
+    bl_label = "Write Report"
+
+    @classmethod
+    def poll(cls, context):
+        return _PROFILER is not None
+
+    def execute(self, context):
+
+        name = "API Browser Performance"
+        text = bpy.data.texts.get(name) or bpy.data.texts.new(name)
+        text.clear()
+        text.write(_PROFILER.report())
+
+        self.report({"INFO"}, f"Report written to '{text.name}'")
+        return {'FINISHED'}
+
+
+class API_OT_Profile_Reset(Operator):
+    """Clears recorded timings"""
+    bl_idname = "api_browser.profile_reset"
+    bl_label = "Reset"
+
+    def execute(self, context):
+
+        if _PROFILER is not None:
+            _PROFILER.phases.clear()
+            _PROFILER.slowest.clear()
+        _PREFETCH_STATS.clear()
+
+        return {'FINISHED'}
+
+
 class API_OT_Copy_Text(Operator):
     """Copy Text"""
     bl_idname = "api_browser.copy_text"
@@ -472,7 +1242,8 @@ class API_OT_Module_Info(Operator):
     bl_idname = "api_browser.module_info"
     bl_label = "Info"
 
-    module = None
+    info = None
+    previews = ()
 
     @classmethod
     def poll(cls, context):
@@ -483,12 +1254,13 @@ class API_OT_Module_Info(Operator):
 
     def invoke(self, context, event):
         path = get_props().path
-        self.module = evaluate(path)
+        self.info = get_object_info(path)
+        self.previews = get_numeric_previews(path)
         return context.window_manager.invoke_popup(self, width=600)
 
     def draw(self, context):
         path = get_props().path
-        current_module = self.module
+        type_text, str_text, doc_text = self.info
         layout = self.layout
 
         def draw_text(text, layout):
@@ -507,9 +1279,14 @@ class API_OT_Module_Info(Operator):
                 draw_text(text, box.column())
 
         draw_section(layout, path)
-        draw_section(layout, "Type:",   str(type(current_module)))
-        draw_section(layout, "Return:", str(current_module))
-        draw_section(layout, "Doc:",    str(current_module.__doc__), icon="INFO")
+        draw_section(layout, "Type:",   type_text)
+        draw_section(layout, "Return:", str_text)
+        draw_section(layout, "Doc:",    doc_text, icon="INFO")
+
+        for preview in self.previews:
+            shape = " x ".join(str(d) for d in preview.shape)
+            draw_section(layout, f"{preview.name}: {preview.dtype} [{shape}]",
+                         preview.text(), icon="GRAPH")
 
 #########################################################################################
 # PANELS
@@ -548,6 +1325,8 @@ class API_PT_Browser(Panel):
 
         # navigation bar
         row = col.row(align=True)
+        row.operator(API_OT_History_Back.bl_idname, text="", icon="LOOP_BACK")
+        row.operator(API_OT_History_Forward.bl_idname, text="", icon="LOOP_FORWARDS")
         row.operator(API_OT_GOTO_Parent.bl_idname, text="Parent", icon="BACK")
         row.operator(API_OT_GOTO_Default.bl_idname, text=prefs.default_module,
                      emboss=True, icon="FILE_PARENT")
@@ -560,6 +1339,27 @@ class API_PT_Browser(Panel):
         row.prop(api_props, "filter", icon='VIEWZOOM', text="")
         row.prop(api_props, "filter_internal",
                  icon='FILTER', text="", toggle=True)
+        row.prop(api_props, "search_api",
+                 icon='WORLD', text="", toggle=True)
+        if api_props.search_api:
+            row.prop(api_props, "search_docs",
+                     icon='TEXT', text="", toggle=True)
+
+        if api_props.search_api:
+            if api_props.search_docs:
+                self.draw_doc_search(layout, api_props.filter, rows * columns)
+            else:
+                self.draw_search(layout, api_props.filter, rows * columns)
+            return
+
+        progress = get_tree_progress(api_props.path)
+        if progress:
+            layout.label(text="Loading {}/{}".format(*progress), icon='SORTTIME')
+        error = get_tree_error(api_props.path)
+        if error:
+            layout.label(text=error, icon='ERROR')
+
+        visible = []    # page cells of expanded categories
 
         for i, category in enumerate(data_tree):
             if not category:
@@ -569,12 +1369,7 @@ class API_PT_Browser(Panel):
             c_label, c_icon = CATEGORIES[i]
             c_enabled = api_props.category_toggles[i]
 
-            page_index = api_props.page_indices[i]
-            page_index = min(page_index, -(len(category) // -count)) # ceil div
-            api_props.page_indices[i] = page_index
-
-            start = (page_index -1) * count
-            end = min(start+count, len(category))
+            start, end = page_bounds(api_props.page_indices, i, len(category), rows, columns)
 
             overflow = len(category) > count
 
@@ -596,20 +1391,161 @@ class API_PT_Browser(Panel):
                 row.prop(api_props, "page_indices", index=i, text="")
 
             if c_enabled:
+                cells = get_page_cells(i, category, start, end)
+                visible.append(cells)
+
                 # items
                 col = box.column(align=True)
                 row = col.row(align=True) # fix for a bug when count isnt't multiple of columns
-                for j, (idx, entry) in zip(range(start, end),category[start:]):
+                for j, (text, info) in enumerate(cells):
                     if not (j % columns):
                         row = col.row(align=True)
 
                     row.operator(API_OT_GOTO_Sub_Module.bl_idname,
-                                 text=str(entry),
+                                 text=text,
                                  emboss=True,
-                    ).info = f'{i} {idx} {entry}'
+                    ).info = info
+
+        schedule_prefetch(api_props.path, visible)
 
         return
 
+    def draw_search(self, layout, query, count):
+
+        index = get_symbol_index()
+        results = index.search(query, count) if query else []
+
+        if not index.done:
+            layout.label(text=f"Indexing {len(index.names)} symbols", icon='SORTTIME')
+
+        box = layout.box()
+        box.label(text=f"API Search ({len(results)})", icon='VIEWZOOM')
+
+        col = box.column(align=True)
+        for path in results:
+            col.operator(API_OT_GOTO_Path.bl_idname, text=path, emboss=True).path = path
+
+    def draw_doc_search(self, layout, query, count):
+
+        index = get_doc_index()
+        results = index.search(query, count) if query else []
+
+        if not index.done:
+            layout.label(text=f"Indexing docs {index.position}/{len(index.symbols.paths)}",
+                         icon='SORTTIME')
+
+        box = layout.box()
+        box.label(text=f"Doc Search ({len(results)})", icon='TEXT')
+
+        col = box.column(align=True)
+        for path in results:
+            col.operator(API_OT_GOTO_Path.bl_idname, text=path, emboss=True).path = path
+
+
+class API_PT_Diff(Panel):
+    bl_idname = "API_PT_Diff"
+    bl_space_type = "TEXT_EDITOR"
+    bl_region_type = "UI"
+    bl_label = "API Diff"
+    bl_parent_id = "API_PT_Browser"
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_category = "Text"
+
+    def draw(self, context):
+
+        prefs = get_preferences()
+        api_props = get_props()
+        count = prefs.rows * prefs.columns
+        filter_text = api_props.filter
+
+        layout = self.layout
+        col = layout.column(align=True)
+        col.prop(api_props, "diff_old", text="Old")
+        col.prop(api_props, "diff_new", text="New")
+        col.operator(API_OT_Diff.bl_idname, icon='ARROW_LEFTRIGHT')
+
+        if _API_DIFF is None:
+            return
+
+        for i, label in enumerate(DIFF_SECTIONS):
+            entries = filter_diff(i, filter_text)
+            enabled = api_props.diff_toggles[i]
+            start, end = page_bounds(api_props.diff_page_indices, i, len(entries), count, 1)
+            overflow = len(entries) > count
+
+            box = layout.box()
+            row = box.row()
+            if overflow:
+                split = row.split(factor=0.8)
+                row = split.row()
+
+            row.alignment = 'LEFT'
+            text = f"{label} ({start+1}-{end} / {len(entries)})" if overflow \
+                   else f"{label} ({len(entries)})"
+            row.prop(api_props, "diff_toggles", index=i, emboss=False, text=text,
+                     icon="DOWNARROW_HLT" if enabled else "RIGHTARROW")
+
+            if overflow:
+                row = split.row()
+                row.alignment = 'RIGHT'
+                row.prop(api_props, "diff_page_indices", index=i, text="")
+
+            if not enabled:
+                continue
+
+            col = box.column(align=True)
+            for text, path in get_page_cells(("diff", i), entries, start, end, diff_cell):
+                if not path:
+                    # gone from the new API, nothing to go to
+                    col.label(text=text)
+                    continue
+                col.operator(API_OT_GOTO_Path.bl_idname, text=text, emboss=True).path = path
+
+
+class API_PT_Performance(Panel):
+    bl_idname = "API_PT_Performance"
+    bl_space_type = "TEXT_EDITOR"
+    bl_region_type = "UI"
+    bl_label = "Performance"
+    bl_parent_id = "API_PT_Browser"
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_category = "Text"
+
+    def draw_header(self, context):
+        self.layout.prop(get_props(), "profile", text="")
+
+    def draw(self, context):
+
+        layout = self.layout
+        profiler = _PROFILER
+
+        col = layout.column(align=True)
+        col.label(text="Prefetch: {} hits, {} misses".format(
+            _PREFETCH_STATS['hits'], _PREFETCH_STATS['misses']))
+
+        if profiler is None:
+            col.label(text="Enable to record timings", icon='INFO')
+            row = layout.row(align=True)
+            row.operator(API_OT_Profile_Reset.bl_idname, icon='X')
+            return
+
+        box = layout.box()
+        col = box.column(align=True)
+        for phase, (calls, total, longest) in sorted(profiler.phases.items()):
+            col.label(text=f"{phase}: {calls} calls, {total * 1e3:.1f} ms, "
+                           f"avg {total / calls * 1e3:.2f} ms, max {longest * 1e3:.2f} ms")
+
+        if profiler.slowest:
+            box = layout.box()
+            col = box.column(align=True)
+            col.label(text="Slowest Members", icon='SORTTIME')
+            for seconds, member in sorted(profiler.slowest, reverse=True):
+                col.label(text=f"{seconds * 1e3:.3f} ms  {member}")
+
+        row = layout.row(align=True)
+        row.operator(API_OT_Profile_Report.bl_idname, icon='TEXT')
+        row.operator(API_OT_Profile_Reset.bl_idname, icon='X')
+
 
 class APIBrowserAddonPreferences(AddonPreferences):
     bl_idname = __name__
@@ -647,6 +1583,34 @@ class APIBrowserAddonPreferences(AddonPreferences):
         description="Automatically Reload Modules",
         default=True,
     )
+    cache_size: IntProperty(
+        name="Cache Size",
+        description="Number of categorized modules to keep in memory",
+        default=32,
+        min=1,
+    )
+    scroll_rows: BoolProperty(
+        name="Scroll By Rows",
+        description="Page spinners scroll one row at a time instead of whole pages",
+        default=True,
+    )
+    prefetch: BoolProperty(
+        name="Prefetch",
+        description="Categorize visible entries, parent and history while idle",
+        default=True,
+    )
+    remote_modules: BoolProperty(
+        name="Out-of-Process Modules",
+        description="Categorize pure Python modules that aren't imported yet "
+                    "in worker processes, without importing them into Blender",
+        default=False,
+    )
+    remote_workers: IntProperty(
+        name="Workers",
+        description="Number of worker processes categorizing modules in parallel",
+        default=2,
+        min=1,
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -660,42 +1624,19 @@ class APIBrowserAddonPreferences(AddonPreferences):
         col.prop(self, "history_size")
         col.prop(self, "restore_history_settings")
         col.prop(self, "auto_reload")
+        col.prop(self, "cache_size")
+        col.prop(self, "scroll_rows")
+        col.prop(self, "prefetch")
+        col.prop(self, "remote_modules")
+        sub = col.column()
+        sub.active = self.remote_modules
+        sub.prop(self, "remote_workers")
 
 
 #########################################################################################
 # PROPERTIES
 #########################################################################################
 
-class API_History_Props(PropertyGroup):
-
-    path: StringProperty(
-        name="Path",
-        description="API path",
-        # default="bpy",
-    )
-    filter: StringProperty(
-        name="Filter",
-        description="Filters matching entries",
-        default="",
-        options={'TEXTEDIT_UPDATE'},
-    )
-    category_toggles: BoolVectorProperty(
-        name="Category Toggles",
-        description="Expand/Collapse Category",
-        default=(True,) * len(CATEGORIES),
-        size=len(CATEGORIES),
-    )
-    page_indices: IntVectorProperty(
-        name="Page Indices",
-        description="Current page indices",
-        default=(1,) * len(CATEGORIES),
-        size=len(CATEGORIES),
-        min=1,
-    )
-
-# API_Props can extend API_History_Props
-# to save redundancy
-# but does not work in blender 2.80
 class API_Props(PropertyGroup):
 
     path: StringProperty(
@@ -710,7 +1651,8 @@ class API_Props(PropertyGroup):
     )
     filter: StringProperty(
         name="Filter",
-        description="Filters matching entries",
+        description="Filters matching entries. Terms: text (Capitals also match "
+                    "camel case humps), re:pattern, type:name, cat:label, -term negates",
         default="",
         options={'TEXTEDIT_UPDATE'},
     )
@@ -733,10 +1675,44 @@ class API_Props(PropertyGroup):
         description="Filters entries starting with '_'",
         default=True,
     )
-    history: CollectionProperty(
-        type=API_History_Props,
-        name="API History Props",
-        description="Previous Paths",
+    search_api: BoolProperty(
+        name="Search API",
+        description="Searches symbols of the whole API instead of the current module",
+        default=False,
+    )
+    search_docs: BoolProperty(
+        name="Search Docs",
+        description="Searches docstrings and descriptions instead of names",
+        default=False,
+    )
+    diff_old: EnumProperty(
+        name="Old API",
+        description="Snapshot to compare from",
+        items=snapshot_items,
+    )
+    diff_new: EnumProperty(
+        name="New API",
+        description="Snapshot to compare to",
+        items=snapshot_items,
+    )
+    profile: BoolProperty(
+        name="Profile",
+        description="Records timings of evaluating, categorizing, filtering and drawing",
+        default=False,
+        update=update_profiling,
+    )
+    diff_toggles: BoolVectorProperty(
+        name="Diff Toggles",
+        description="Expand/Collapse Diff Section",
+        default=(True,) * len(DIFF_SECTIONS),
+        size=len(DIFF_SECTIONS),
+    )
+    diff_page_indices: IntVectorProperty(
+        name="Diff Page Indices",
+        description="Current page indices of diff sections",
+        default=(1,) * len(DIFF_SECTIONS),
+        size=len(DIFF_SECTIONS),
+        min=1,
     )
 
 
@@ -749,15 +1725,22 @@ classes = (
     API_MT_History_Menu,
     API_OT_History_Clear,
     API_OT_History,
+    API_OT_History_Back,
+    API_OT_History_Forward,
     API_OT_GOTO_Parent,
     API_OT_GOTO_Default,
     API_OT_GOTO_Sub_Module,
+    API_OT_GOTO_Path,
     API_OT_Reload_Module,
+    API_OT_Diff,
+    API_OT_Profile_Report,
+    API_OT_Profile_Reset,
     API_OT_Copy_Text,
     API_OT_Module_Info,
     API_PT_Browser,
+    API_PT_Diff,
+    API_PT_Performance,
     APIBrowserAddonPreferences,
-    API_History_Props,
     API_Props,
 )
 
@@ -774,8 +1757,34 @@ def register():
 
     get_props().path = get_preferences().default_module
 
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_data_reset)
+    bpy.app.handlers.undo_post.append(on_data_reset)
+    bpy.app.handlers.redo_post.append(on_data_reset)
+
 
 def unregister():
+    global _PROFILER, _WORKER_POOL
+
+    if _PROFILER is not None:
+        _PROFILER.uninstall()
+        _PROFILER = None
+
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.shutdown()
+        _WORKER_POOL = None
+
+    bpy.app.handlers.redo_post.remove(on_data_reset)
+    bpy.app.handlers.undo_post.remove(on_data_reset)
+    bpy.app.handlers.load_post.remove(on_data_reset)
+    bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    stop_categorize_timer()
+    for timer in (symbol_index_timer, doc_index_timer, prefetch_timer):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+    save_snapshot()
+    invalidate_tree_cache()
+    clear_history()
 
     del bpy.types.WindowManager.api_props
 
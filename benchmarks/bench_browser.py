@@ -0,0 +1,171 @@
+"""Benchmarks of categorizing, filtering, paging, evaluating and drawing
+on synthetic objects, reports best time and peak traced memory
+
+Run with plain Python or inside Blender:
+    python benchmarks/bench_browser.py
+    blender --background --python benchmarks/bench_browser.py
+"""
+
+import os, sys, time, types, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import load_addon
+import stub_bpy
+
+
+def make_wide(count=10_000):
+    """Instance of a class with count attributes"""
+    return type("Wide", (), {f"attr_{i}": i for i in range(count)})()
+
+
+def make_deep(depth=300):
+    """Instance of a class with a depth long MRO"""
+    cls = object
+    for i in range(depth):
+        cls = type(f"Level{i}", (cls,), {f"member_{i}": i})
+    return cls()
+
+
+def make_slow(count=200, delay=50e-6):
+    """Instance whose properties take delay seconds each"""
+    def getter(self, delay=delay):
+        end = time.perf_counter() + delay
+        while time.perf_counter() < end:
+            pass
+        return 0
+    return type("Slow", (), {f"slow_{i}": property(getter) for i in range(count)})()
+
+
+def make_nested(depth=20):
+    """Namespace chain a.a.a... with a list at the end"""
+    root = node = types.SimpleNamespace()
+    for _ in range(depth):
+        node.a = types.SimpleNamespace()
+        node = node.a
+    node.items = list(range(100))
+    return root
+
+
+def make_levels(depth=8, width=20):
+    """Namespace whose width children share one namespace, depth levels down"""
+    node = types.SimpleNamespace()
+    for _ in range(depth):
+        node = types.SimpleNamespace(**{f"child_{i}": node for i in range(width)})
+    return node
+
+
+def objects_module():
+    return stub_bpy._module(
+        "bench_objects",
+        wide=make_wide(), deep=make_deep(), slow=make_slow(),
+        huge=list(range(1_000_000)),
+        mapping={f"key_{i}": i for i in range(100_000)},
+        nested=make_nested(), levels=make_levels())
+
+
+def measure(func, setup=None, repeat=5):
+    """Returns (best seconds, peak traced bytes) of func"""
+    best = float('inf')
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def report(name, result):
+    seconds, peak = result
+    print(f"{name:<40}{seconds * 1e3:>10.3f} ms{peak / 1024:>12.1f} KiB")
+
+
+def main():
+    addon = load_addon()
+    core = addon.core
+    objects = objects_module()
+    props = addon.get_props()
+    # snapshots of the real config dir shouldn't interfere
+    addon._SNAPSHOT = False
+
+    def cold():
+        addon.invalidate_tree_cache()
+        addon._DATA_TREE = None
+
+    print(f"{'Benchmark':<40}{'Best':>13}{'Peak':>16}")
+
+    # categorize
+    for name in ("wide", "deep", "slow", "huge", "mapping"):
+        obj = getattr(objects, name)
+        report(f"categorize {name}", measure(lambda: core.object_categories(obj), cold))
+
+    addon.get_cached_tree("bench_objects.wide")
+    stub_bpy.run_timers()
+    report("cached tree lookup", measure(lambda: addon.get_cached_tree("bench_objects.wide")))
+
+    # filter, typing one character at a time
+    tree = core.object_categories(objects.wide)
+    queries = ("a", "at", "att", "attr", "attr_", "attr_9", "attr_99")
+
+    def typing():
+        tree_filter = core.TreeFilter(tree)
+        for query in queries:
+            tree_filter.filter(query, True)
+
+    report(f"filter typing {len(queries)} keys", measure(typing))
+    tree_filter = core.TreeFilter(tree)
+    tree_filter.filter("attr_9", True)
+    report("filter unchanged query", measure(lambda: tree_filter.filter("attr_9", True)))
+
+    # paging through a million values
+    def paging(pages=100, count=30):
+        view = core.LazyView(objects.huge).enumerated()
+        for page in range(pages):
+            addon.get_page_cells(1, view, page * count, (page + 1) * count)
+
+    report("paging huge 100 pages", measure(paging, addon._PAGE_CACHE.clear))
+
+    # evaluate
+    path = "bench_objects.nested" + ".a" * 20 + ".items[99]"
+    report("evaluate nested cold", measure(lambda: addon.evaluate(path),
+                                           addon.invalidate_tree_cache))
+    report("evaluate nested warm", measure(lambda: addon.evaluate(path)))
+    report("evaluate_expression nested", measure(lambda: core.evaluate_expression(path)))
+
+    # draw
+    def draw():
+        panel = addon.API_PT_Browser()
+        panel.layout = stub_bpy.Layout()
+        panel.draw(None)
+
+    for name in ("wide", "huge"):
+        props.path = props.old_path = f"bench_objects.{name}"
+        report(f"draw {name} first frame", measure(draw, cold))
+        stub_bpy.run_timers()
+        report(f"draw {name} warm", measure(draw))
+
+    # navigating down, each child should be prefetched while idle
+    cold()
+    addon._PREFETCH_STATS.clear()
+    props.path = props.old_path = "bench_objects.levels"
+    for step in range(6):
+        draw()
+        stub_bpy.run_timers()
+        props.path += f".child_{step}"
+    draw()
+
+    stats = addon._PREFETCH_STATS
+    print(f"prefetch 6 navigations: {stats['hits']} hits, {stats['misses']} misses")
+    assert stats['misses'] == 0, "prefetched trees were evicted before use"
+
+
+if __name__ == "__main__":
+    main()
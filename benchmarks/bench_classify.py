@@ -0,0 +1,67 @@
+"""Micro-benchmark of member classification, str(type()) matching vs type_category
+
+Run with plain Python or inside Blender:
+    python benchmarks/bench_classify.py
+    blender --background --python benchmarks/bench_classify.py
+"""
+
+import os, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import load_addon
+
+
+def str_category(value):
+    """Classification as done before type_category"""
+    styp = str(type(value))
+
+    if styp == "<class 'module'>":
+        return 2
+    elif styp.startswith("<class 'bpy_prop"):
+        return 4
+    elif styp.startswith("<class 'bpy"):
+        return 5
+    elif styp == "<class 'builtin_function_or_method'>":
+        return 6
+    elif styp == "<class 'type'>":
+        return 3
+    else:
+        return 7
+
+
+def collect_values(roots, size):
+    """Member values of roots, repeated until size values"""
+    values = []
+    for root in roots:
+        for word in dir(root):
+            try:
+                values.append(getattr(root, word))
+            except Exception:
+                pass
+    return (values * (size // max(len(values), 1) + 1))[:size]
+
+
+def main(size=200_000, repeat=5):
+    addon = load_addon()
+
+    import builtins, bpy
+    roots = [builtins, bpy, bpy.types, bpy.data, bpy.context, sys, os]
+    values = collect_values(roots, size)
+
+    assert [str_category(v) for v in values] == \
+           [addon.core.type_category(type(v)) for v in values], "results differ"
+
+    type_category = addon.core.type_category
+    old = min(timeit.repeat(lambda: [str_category(v) for v in values],
+                            number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: [type_category(type(v)) for v in values],
+                            number=1, repeat=repeat))
+
+    print(f"members:       {len(values)}")
+    print(f"str matching:  {old * 1e3:8.2f} ms ({old / len(values) * 1e9:6.1f} ns/member)")
+    print(f"type_category: {new * 1e3:8.2f} ms ({new / len(values) * 1e9:6.1f} ns/member)")
+    print(f"speedup:       {old / new:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
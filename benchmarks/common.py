@@ -0,0 +1,23 @@
+"""Helpers shared by the benchmarks"""
+
+import os, sys, importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_addon():
+    """Imports the add-on as 'api_browser', on plain CPython with stub_bpy"""
+    try:
+        import bpy
+    except ImportError:
+        import stub_bpy
+        stub_bpy.install()
+
+    spec = importlib.util.spec_from_file_location(
+        "api_browser", os.path.join(ROOT, "__init__.py"),
+        submodule_search_locations=[ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,140 @@
+"""Lightweight stand-in for bpy, enough to import the add-on and draw
+its panel under plain CPython"""
+
+import sys, types, tempfile, os
+
+
+class StubStruct:
+    """Base of registrable classes"""
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class Operator(StubStruct): pass
+class Menu(StubStruct): pass
+class Panel(StubStruct): pass
+class PropertyGroup(StubStruct): pass
+class AddonPreferences(StubStruct): pass
+
+
+class bpy_struct:
+    pass
+
+
+class Layout:
+    """UILayout stand-in counting emitted buttons"""
+
+    def __init__(self):
+        self.operators = 0
+        self.labels = 0
+        self.alignment = 'EXPAND'
+        self.use_property_split = False
+        self.use_property_decorate = True
+
+    def _sub(self, *args, **kwargs):
+        return self
+
+    row = column = box = split = _sub
+
+    def operator(self, *args, **kwargs):
+        self.operators += 1
+        return types.SimpleNamespace()
+
+    def label(self, *args, **kwargs):
+        self.labels += 1
+
+    def prop(self, *args, **kwargs):
+        pass
+
+    def separator(self, *args, **kwargs):
+        pass
+
+
+class Props:
+    """API_Props stand-in, vectors assigned as tuples stay mutable"""
+
+    def __init__(self, categories=9):
+        self.path = ""
+        self.old_path = ""
+        self.filter = ""
+        self.filter_internal = True
+        self.search_api = False
+        self.search_docs = False
+        self.profile = False
+        self.category_toggles = [True] * categories
+        self.page_indices = [1] * categories
+        self.diff_toggles = [True] * 3
+        self.diff_page_indices = [1] * 3
+
+    def __setattr__(self, name, value):
+        if isinstance(value, tuple):
+            value = list(value)
+        super().__setattr__(name, value)
+
+
+def _prop(*args, **kwargs):
+    return None
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """Installs the stand-in modules into sys.modules, returns bpy"""
+
+    bpy_types = _module(
+        "bpy.types", bpy_struct=bpy_struct, Operator=Operator, Menu=Menu,
+        Panel=Panel, PropertyGroup=PropertyGroup, AddonPreferences=AddonPreferences,
+        WindowManager=type("WindowManager", (), {}))
+
+    bpy_props = _module("bpy.props", **{name: _prop for name in (
+        "IntProperty", "FloatProperty", "StringProperty", "BoolProperty",
+        "EnumProperty", "PointerProperty", "CollectionProperty",
+        "BoolVectorProperty", "IntVectorProperty", "FloatVectorProperty")})
+
+    timers = []
+    handlers = _module(
+        "bpy.app.handlers", persistent=lambda func: func,
+        depsgraph_update_post=[], load_post=[], undo_post=[], redo_post=[])
+    app_timers = _module(
+        "bpy.app.timers",
+        register=lambda func, first_interval=0, persistent=False: timers.append(func),
+        unregister=timers.remove,
+        is_registered=timers.__contains__)
+    app_timers.pending = timers
+    app = _module("bpy.app", version=(0, 0, 0), handlers=handlers, timers=app_timers)
+
+    def user_resource(resource_type, path="", create=False):
+        target = os.path.join(tempfile.gettempdir(), "api_browser_bench", path)
+        if create:
+            os.makedirs(target, exist_ok=True)
+        return target
+
+    utils = _module("bpy.utils", register_class=_prop, unregister_class=_prop,
+                    user_resource=user_resource)
+
+    window_manager = types.SimpleNamespace(api_props=Props(), windows=[], clipboard="")
+    context = types.SimpleNamespace(
+        window_manager=window_manager,
+        preferences=types.SimpleNamespace(addons={}))
+    data = types.SimpleNamespace(texts={})
+
+    bpy = _module("bpy", types=bpy_types, props=bpy_props, app=app, utils=utils,
+                  context=context, data=data)
+
+    return bpy
+
+
+def run_timers(limit=100000):
+    """Runs registered timers until they finish"""
+    pending = sys.modules["bpy.app.timers"].pending
+    for _ in range(limit):
+        if not pending:
+            return
+        func = pending[0]
+        if func() is None and func in pending:
+            pending.remove(func)
@@ -0,0 +1,1125 @@
+"""Introspection core of the API Browser: evaluating paths, categorizing
+and filtering members. Doesn't import bpy, usable outside Blender"""
+
+import re, ast, builtins, sys, os, time, weakref, functools, reprlib, itertools, threading
+from array import array
+from collections import OrderedDict
+
+
+# labels, icons(unused)
+CATEGORIES = (
+    ('Items', 'TRIA_DOWN'),
+    ('Values', 'TRIA_DOWN'),
+    ('Modules', 'PACKAGE'),
+    ('Types', 'WORDWRAP_ON'),
+    ('Properties', 'DOT'),
+    ('Structs and Functions', 'QUESTION'),
+    ('Methods and Functions', 'SCRIPT'),
+    ('Attributes', 'INFO'),
+    ('Inaccessible', 'ERROR'),
+)
+
+# category indices
+ITEMS, VALUES, MODULES, TYPES, PROPERTIES, STRUCTS, METHODS, ATTRIBUTES, INACCESSIBLE = \
+    range(len(CATEGORIES))
+
+# type -> category index, filled on first sight of a type, cleared by clear_caches
+_TYPE_CATEGORIES = {}
+
+# class -> frozenset of member names, released with the class
+_CLASS_MEMBERS = weakref.WeakKeyDictionary()
+
+# bpy_struct subclass -> {member name: category index} from RNA metadata
+_RNA_CATEGORIES = weakref.WeakKeyDictionary()
+
+# float array subtypes returned as mathutils objects, with their lengths,
+# as converted by pyrna_math_object_from_array; other arrays, like
+# AXISANGLE, stay bpy_prop_array
+_MATHUTILS_SUBTYPES = {
+    'MATRIX': (9, 16),
+    'COORDINATES': (2, 3, 4),
+    'TRANSLATION': (2, 3, 4),
+    'DIRECTION': (2, 3, 4),
+    'VELOCITY': (2, 3, 4),
+    'ACCELERATION': (2, 3, 4),
+    'XYZ': (2, 3, 4),
+    'XYZ_LENGTH': (2, 3, 4),
+    'EULER': (3, 4),        # Euler, or Quaternion of length 4
+    'QUATERNION': (3, 4),   # Quaternion, or Euler of length 3
+    'COLOR': (3,),
+    'COLOR_GAMMA': (3,),
+}
+
+# id(tree) -> TreeFilter of recently filtered trees
+_TREE_FILTERS = OrderedDict()
+TREE_FILTERS_SIZE = 8
+# query results kept per TreeFilter, for editing back to an earlier query
+FILTER_RESULTS = 16
+
+# query term prefixes
+QUERY_KINDS = ('re', 'type', 'cat')
+# start of a word in a name, after a non alphanumeric or a lower to upper case change
+_WORD_START = r'(?:(?<![A-Za-z0-9])|(?<=[a-z0-9])(?=[A-Z]))'
+_HUMP = re.compile(r'[A-Z][a-z0-9]*|[a-z0-9]+')
+
+# bumped by change handlers, entries from older generations get revalidated
+_CACHE_GENERATION = 0
+
+
+class GenerationCache(OrderedDict):
+    """Bounded LRU cache, emptied when the cache generation changes"""
+
+    def __init__(self, size):
+        super().__init__()
+        self.size = size
+        self.generation = _CACHE_GENERATION
+
+    def lookup(self, key, default=None):
+        if self.generation != _CACHE_GENERATION:
+            self.clear()
+            self.generation = _CACHE_GENERATION
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def store(self, key, value):
+        self[key] = value
+        extra = len(self) - self.size
+        for _ in range(extra):
+            self.popitem(last=False)
+
+
+# path prefix -> resolved object
+_OBJECT_CACHE = GenerationCache(256)
+# path -> tooltip text
+_DESCRIPTION_CACHE = GenerationCache(128)
+
+# characters of str(value) shown in tooltips
+DESCRIPTION_LENGTH = 1000
+_SHORT_REPR = reprlib.Repr()
+_SHORT_REPR.maxstring = _SHORT_REPR.maxother = DESCRIPTION_LENGTH
+
+# entries stringified around the requested window of a LazyView
+LAZY_PREFETCH = 32
+
+# as_pointer() of ID datablocks -> number of depsgraph updates seen
+_UPDATE_TAGS = {}
+
+# sys.path entry -> (mtime, module names), written by the scan thread
+_ROOT_MODULES = {}
+# thread scanning changed sys.path entries
+_ROOT_SCAN = None
+# (root_modules_key(), sorted names) of the last complete listing
+_ROOT_NAMES = None
+
+
+def cache_generation():
+    return _CACHE_GENERATION
+
+
+def bump_cache_generation():
+    """Forces cached entries to be revalidated on next access"""
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+
+
+def clear_caches():
+    """Drops resolved objects, descriptions, type categories, class members and filters"""
+    # releases types of unregistered classes and reloaded modules
+    _TYPE_CATEGORIES.clear()
+    # classes can gain members, eg. registered properties
+    _CLASS_MEMBERS.clear()
+    _RNA_CATEGORIES.clear()
+    _OBJECT_CACHE.clear()
+    _DESCRIPTION_CACHE.clear()
+    _TREE_FILTERS.clear()
+    _UPDATE_TAGS.clear()
+
+
+def tag_updated(pointer):
+    """Counts an update of the datablock at pointer, changing its fingerprint"""
+    _UPDATE_TAGS[pointer] = _UPDATE_TAGS.get(pointer, 0) + 1
+
+
+def bpy_struct_type():
+    """Returns bpy.types.bpy_struct, or an empty tuple outside Blender
+    so isinstance checks against it fail"""
+    bpy = sys.modules.get('bpy')
+    return bpy.types.bpy_struct if bpy is not None else ()
+
+
+def root_modules_key():
+    """Returns (entry, mtime) of sys.path entries, changes when
+    root modules may have been added or removed"""
+    key = []
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime_ns
+        except OSError:
+            mtime = None
+        key.append((path, mtime))
+    return tuple(key)
+
+
+def scan_directories(entries):
+    """Lists modules of (path, mtime) entries, runs on the scan thread"""
+    import pkgutil
+
+    for path, mtime in entries:
+        names = []
+        if mtime is not None:
+            names = [module.name for module in pkgutil.iter_modules([path or os.curdir])]
+        _ROOT_MODULES[path] = (mtime, names)
+
+
+def scan_root_modules(wait=True):
+    """Rescans sys.path entries changed since they were last scanned on a
+    worker thread, returns whether root modules are up to date"""
+    global _ROOT_SCAN
+
+    if _ROOT_SCAN is not None and _ROOT_SCAN.is_alive():
+        if not wait:
+            return False
+        _ROOT_SCAN.join()
+
+    stale = [(path, mtime) for path, mtime in root_modules_key()
+             if _ROOT_MODULES.get(path, (False,))[0] != mtime]
+    if not stale:
+        return True
+
+    _ROOT_SCAN = threading.Thread(target=scan_directories, args=(stale,),
+                                  name="API Browser root modules", daemon=True)
+    _ROOT_SCAN.start()
+
+    if wait:
+        _ROOT_SCAN.join()
+    return wait
+
+
+def root_modules():
+    """Returns names of importable top level modules, waits for changed
+    sys.path entries to be scanned"""
+    global _ROOT_NAMES
+
+    scan_root_modules()
+    key = root_modules_key()
+    if _ROOT_NAMES is not None and _ROOT_NAMES[0] == key:
+        return _ROOT_NAMES[1]
+
+    names = set(sys.builtin_module_names)
+    for path in sys.path:
+        names.update(_ROOT_MODULES.get(path, (None, ()))[1])
+    names.discard('__init__')
+
+    _ROOT_NAMES = key, sorted(names)
+    return _ROOT_NAMES[1]
+
+
+def filter_categories(tree, filter_text, filter_internal):
+    """Returns filtered categories of tree as FilteredViews,
+    filter_text is a query, see Query"""
+
+    tree_filter = _TREE_FILTERS.get(id(tree))
+    if tree_filter is None:
+        tree_filter = _TREE_FILTERS[id(tree)] = TreeFilter(tree)
+        extra = len(_TREE_FILTERS) - TREE_FILTERS_SIZE
+        for _ in range(extra):
+            _TREE_FILTERS.popitem(last=False)
+    else:
+        _TREE_FILTERS.move_to_end(id(tree))
+
+    return tree_filter.filter(filter_text, filter_internal)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_query(text):
+    """Returns the Query of text, compiled once per query string"""
+    return Query(text)
+
+
+def name_test(kind, arg):
+    """Returns test(name, lowercased name) of a 're:' or plain query term"""
+
+    if kind == 're':
+        # case sensitive only with capitals in the pattern
+        flags = 0 if arg.lower() != arg else re.IGNORECASE
+        try:
+            regex = re.compile(arg, flags)
+        except re.error:
+            # incomplete while typing
+            regex = re.compile(re.escape(arg), flags)
+        return lambda name, lower: regex.search(name) is not None
+
+    # capitals also match camel case humps, 'MeMo' matches 'MeshModifier'
+    humps = _HUMP.findall(arg)
+    if arg.lower() == arg or not humps:
+        arg = arg.lower()
+        return lambda name, lower: arg in lower
+
+    low = arg.lower()
+    longest = max(humps, key=len).lower()
+    hump = re.compile('.*?'.join(f'{_WORD_START}(?i:{re.escape(h)})' for h in humps))
+    # the regex only runs on names containing the longest hump
+    return lambda name, lower: low in lower or (
+        longest in lower and hump.search(name) is not None)
+
+
+def term_implies(term, other):
+    """Returns whether entries matching query term also match other,
+    like 'attr' after 'at' while typing"""
+
+    if term == other:
+        return True
+    negate, kind, arg = term
+    other_negate, other_kind, other_arg = other
+    if negate or other_negate or kind != other_kind or kind == 're':
+        return False
+
+    if kind == 'type' or arg.lower() == arg:
+        return other_arg.lower() in arg.lower()
+    # camel case humps only grow or get added when extending an alphanumeric term
+    return arg.startswith(other_arg) and other_arg.isascii() and other_arg.isalnum()
+
+
+class Query:
+    """Filter query of whitespace separated terms, entries match all of them:
+        text        contains text, ignoring case; with capitals also camel case humps
+        re:pattern  regular expression, ignoring case unless it has capitals
+        type:name   type name of the value contains name
+        cat:label   category label contains label, several select any of them
+        -term       doesn't match term"""
+
+    __slots__ = ('text', 'terms', 'substrings', 'name_tests', 'type_tests', 'categories')
+
+    def __init__(self, text):
+        self.text = text
+        self.terms = []         # (negate, kind, arg)
+        self.substrings = []    # plain lowercase terms, tested first
+        self.name_tests = []    # (negate, test(name, lower))
+        self.type_tests = []    # (negate, lowercase type name part)
+
+        included = None     # all categories unless selected by cat: terms
+        excluded = set()
+
+        for word in text.split():
+            negate = word.startswith('-')
+            if negate:
+                word = word[1:]
+            kind, sep, arg = word.partition(':')
+            if not sep or kind not in QUERY_KINDS:
+                kind, arg = '', word
+            if not arg:
+                continue    # still typing
+
+            self.terms.append((negate, kind, arg))
+
+            if kind == 'cat':
+                arg = arg.lower()
+                cats = {i for i, (label, _) in enumerate(CATEGORIES) if arg in label.lower()}
+                if negate:
+                    excluded.update(cats)
+                else:
+                    included = cats if included is None else included | cats
+            elif kind == 'type':
+                self.type_tests.append((negate, arg.lower()))
+            elif not negate and not kind and arg.lower() == arg:
+                self.substrings.append(arg)
+            else:
+                self.name_tests.append((negate, name_test(kind, arg)))
+
+        if included is None:
+            included = range(len(CATEGORIES))
+        self.categories = frozenset(included).difference(excluded)
+
+    def __bool__(self):
+        return bool(self.terms)
+
+    def narrows(self, previous):
+        """Returns whether matches of self are a subset of matches of previous
+        in categories both select, every term of previous is implied by one of self"""
+        return all(any(term_implies(term, other) for term in self.terms)
+                   for other in previous.terms if other[1] != 'cat')
+
+    def match_name(self, name, lower):
+        for arg in self.substrings:
+            if arg not in lower:
+                return False
+        for negate, test in self.name_tests:
+            if test(name, lower) == negate:
+                return False
+        return True
+
+    def match_type(self, type_name):
+        for negate, arg in self.type_tests:
+            if (arg in type_name) == negate:
+                return False
+        return True
+
+    def match_value(self, value):
+        text = str(value)
+        return self.match_name(text, text.lower()) \
+            and (not self.type_tests or self.match_type(type(value).__name__.lower()))
+
+
+class TreeFilter:
+    """Filters categories of a tree by queries, keeping lowercased names,
+    type names and the results of recent queries to narrow down on the next"""
+
+    def __init__(self, tree):
+        self.tree = tree    # referenced, so id(tree) stays unique
+        self.lower = []     # lowercased tree.names
+        self.types = {}     # name index -> lowercased type name, for type: terms
+        # (query text, filter_internal) -> [(category size, result)], most recent last
+        self.results = OrderedDict()
+
+    def filter(self, filter_text, filter_internal):
+        query = compile_query(filter_text)
+        key = (filter_text, filter_internal)
+
+        results = self.results.pop(key, None) or [None] * len(self.tree)
+        recent = list(reversed(self.results.items()))
+
+        for i in range(len(self.tree)):
+            results[i] = self.filter_category(i, query, filter_internal, results[i], recent)
+
+        self.results[key] = results
+        extra = len(self.results) - FILTER_RESULTS
+        for _ in range(extra):
+            self.results.popitem(last=False)
+
+        return [result for _, result in results]
+
+    def filter_category(self, i, query, filter_internal, memo, recent):
+        """Returns (category size, FilteredView) of category i, memo is the
+        previous result of the same query, recent the results of other queries"""
+
+        cat = self.tree[i]
+        size = len(cat)
+        lazy = isinstance(cat, LazyView)
+
+        if memo and memo[0] == size:
+            return memo
+
+        if i not in query.categories:
+            return size, FilteredView(cat, array('I'))
+
+        # cat: terms only select categories, and keys and values are data,
+        # not internal members
+        if not (query.substrings or query.name_tests or query.type_tests) \
+                and (lazy or not filter_internal):
+            return size, FilteredView(cat, range(size))
+
+        # only earlier matches and entries added since (by an unfinished
+        # CategorizeJob) can match the same query or one narrowing a recent one
+        if memo and memo[0] <= size:
+            candidates = itertools.chain(memo[1].ids, range(memo[0], size))
+        else:
+            candidates = range(size)
+            best = None
+            for (text, internal), results in recent:
+                previous = results[i]
+                if not previous or previous[0] > size \
+                        or (best and len(previous[1]) >= len(best[1])) \
+                        or (internal and not filter_internal and not lazy):
+                    continue
+                recent_query = compile_query(text)
+                if i in recent_query.categories and query.narrows(recent_query):
+                    best = previous
+            if best:
+                candidates = itertools.chain(best[1].ids, range(best[0], size))
+
+        if lazy:
+            source = cat.source
+            match_value = query.match_value
+            ids = array('I', (idx for idx in candidates if match_value(source[idx])))
+            return size, FilteredView(cat, ids)
+
+        lower = self.lower
+        names = self.tree.names
+        if len(lower) < len(names):
+            lower.extend(name.lower() for name in names[len(lower):])
+
+        # cheapest tests first, each over the survivors of the previous
+        name_ids = cat.ids
+        ids = candidates
+        if filter_internal:
+            ids = [idx for idx in ids if not lower[name_ids[idx]].startswith('_')]
+        for arg in query.substrings:
+            ids = [idx for idx in ids if arg in lower[name_ids[idx]]]
+        for negate, test in query.name_tests:
+            ids = [idx for idx in ids
+                   if test(names[name_ids[idx]], lower[name_ids[idx]]) != negate]
+        for negate, arg in query.type_tests:
+            type_name = self.type_name
+            ids = [idx for idx in ids if (arg in type_name(name_ids[idx])) != negate]
+
+        return size, FilteredView(cat, array('I', ids))
+
+    def type_name(self, j):
+        """Returns lowercased type name of the value of name j, empty if unknown"""
+        try:
+            return self.types[j]
+        except KeyError:
+            pass
+
+        source = getattr(self.tree, 'source', None)
+        try:
+            name = type(getattr(source, self.tree.names[j])).__name__.lower() \
+                if source is not None else ''
+        except:
+            name = ''
+
+        self.types[j] = name
+        return name
+
+
+class FilteredView:
+    """Entries of a category selected by their indices, an array('I')
+    or a range for all entries; slices are (index, entry) pairs"""
+    __slots__ = ('category', 'ids')
+
+    def __init__(self, category, ids):
+        self.category = category
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, key):
+        ids = self.ids[key]
+        category = self.category
+
+        if isinstance(ids, range):
+            return list(zip(ids, category[ids.start:ids.stop]))
+        if isinstance(category, LazyView):
+            source = category.source
+            return [(idx, str(source[idx])) for idx in ids]
+        return [(idx, category[idx]) for idx in ids]
+
+
+class CompactTree:
+    """Categorized member names as one table of interned names, the
+    category id of each name and per category the indices of its names;
+    Items and Values are LazyViews of data instead"""
+
+    def __init__(self, items=None, values=None, source=None):
+        self.source = source    # categorized object, for type: queries
+        self.error = None       # why source couldn't be categorized
+        self.names = []
+        self.categories = array('B')
+        self.views = [CategoryView(self.names, self.categories, cat)
+                      for cat in range(len(CATEGORIES))]
+        if items is not None:
+            self.views[ITEMS] = items
+        if values is not None:
+            self.views[VALUES] = values
+
+    @classmethod
+    def from_categories(cls, categories):
+        tree = cls()
+        for cat, names in enumerate(categories):
+            tree.views[cat].extend(names)
+        return tree
+
+    def add(self, cat, name):
+        self.views[cat].ids.append(len(self.names))
+        self.names.append(sys.intern(name))
+        self.categories.append(cat)
+
+    def __len__(self):
+        return len(self.views)
+
+    def __getitem__(self, cat):
+        return self.views[cat]
+
+    def __iter__(self):
+        return iter(self.views)
+
+
+class CategoryView:
+    """Names of one category of a CompactTree"""
+    __slots__ = ('names', 'categories', 'cat', 'ids')
+
+    def __init__(self, names, categories, cat):
+        self.names = names
+        self.categories = categories
+        self.cat = cat
+        self.ids = array('I')   # indices into names
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            names = self.names
+            return [names[i] for i in self.ids[key]]
+        return self.names[self.ids[key]]
+
+    def __iter__(self):
+        names = self.names
+        return (names[i] for i in self.ids)
+
+    def append(self, name):
+        self.ids.append(len(self.names))
+        self.names.append(sys.intern(name))
+        self.categories.append(self.cat)
+
+    def extend(self, names):
+        for name in names:
+            self.append(name)
+
+
+_PATH_ROOT = re.compile(r"\s*([a-zA-Z_][a-zA-Z0-9_-]*)") # '-' for 'API_Browser-main'
+_PATH_STEP = re.compile(r"""
+      \s*\.\s*(?P<attr>[a-zA-Z_][a-zA-Z0-9_]*)
+    | \s*\[\s*(?P<index>-?[0-9]+)\s*\]
+    | \s*\[\s*(?P<key>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")\s*\]
+""", re.VERBOSE)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(path):
+    """Returns steps of path as (prefix, is_attr, name or key) tuples,
+    first step is the root name; None if path needs eval"""
+
+    match = _PATH_ROOT.match(path)
+    if not match:
+        return None
+
+    steps = [(path[:match.end()], True, match.group(1))]
+    pos = match.end()
+
+    while pos < len(path):
+        match = _PATH_STEP.match(path, pos)
+        if not match:
+            return None
+        pos = match.end()
+
+        attr, index, key = match.group('attr', 'index', 'key')
+        if attr:
+            steps.append((path[:pos], True, attr))
+        elif index:
+            steps.append((path[:pos], False, int(index)))
+        else:
+            steps.append((path[:pos], False, ast.literal_eval(key)))
+
+    return tuple(steps)
+
+
+def resolve_steps(steps):
+    """Resolves compiled steps, starting from the nearest cached ancestor;
+    the last step is always resolved again, it may have been rebound"""
+
+    missing = _OBJECT_CACHE     # sentinel, never cached
+    start = 0
+    for i in range(len(steps) - 2, -1, -1):
+        obj = _OBJECT_CACHE.lookup(steps[i][0], missing)
+        if obj is not missing:
+            start = i + 1
+            break
+
+    for i in range(start, len(steps)):
+        prefix, is_attr, name = steps[i]
+
+        if i == 0:
+            if name in builtins.__dict__:
+                obj = builtins.__dict__[name]
+            else:
+                obj = __import__(name)
+        elif is_attr:
+            obj = getattr(obj, name)
+        else:
+            obj = obj[name]
+
+        _OBJECT_CACHE.store(prefix, obj)
+
+    return obj
+
+
+def is_loaded(path):
+    """Returns whether evaluating path imports nothing, its root is
+    a builtin or an already imported module"""
+    steps = compile_path(path.strip()) if path else None
+    if not steps:
+        return False
+    root = steps[0][2]
+    return root in builtins.__dict__ or root in sys.modules
+
+
+def evaluate(path):
+    """Returns Python Object from String Path"""
+    path = path.strip()
+    steps = compile_path(path)
+
+    if steps is None:
+        return evaluate_expression(path)
+
+    try:
+        return resolve_steps(steps)
+    except Exception as e:
+        return e
+
+
+def evaluate_expression(path):
+    """Returns Python Object from String Path using eval"""
+    try:
+        parts = re.split('([^a-zA-Z0-9_-])', path.strip(), 1) # '-' for 'API_Browser-main'
+        if parts[0] in dir(builtins):
+            namespace = {}
+        else:
+            try:
+                # replace parts[0] with 'mod' incase of illegal mod-name
+                # eg. '-' in 'API_Browser-main'
+                namespace = {'mod': __import__(parts[0])}
+                parts[0] = 'mod'
+            except:
+                namespace = {}
+        
+        return  eval("".join(parts), namespace)
+    except Exception as e:
+        return e
+
+
+def parent(path):
+    """Returns the parent path"""
+    # TODO: fix ['" characters in key
+    return path.rpartition('[' if path.endswith(']') else '.')[0]   # rsplit() not used
+
+
+def resolve_path(path, info):
+    """Returns Submodule path from info=(cat, idx, word) tuple"""
+
+    cat, idx, word = info.split(" ", maxsplit=2)
+    cat = int(cat)
+
+    if cat == ITEMS:  # key
+        key = word
+        # escape \' characters
+        key = key.replace("\\", "\\\\").replace("'", "\\'")
+        path += f"['{key}']"
+
+    elif cat == VALUES:  # index
+        path += f"[{idx}]"
+
+    else:
+        if path:
+            path += '.'
+        path += word
+
+    return path
+
+
+def get_module_description(path):
+    desc = _DESCRIPTION_CACHE.lookup(path)
+    if desc is not None:
+        return desc
+
+    desc = rna_member_description(path)
+    if desc is not None:
+        _DESCRIPTION_CACHE.store(path, desc)
+        return desc
+
+    desc = describe(evaluate(path))
+    _DESCRIPTION_CACHE.store(path, desc)
+    return desc
+
+
+def describe(obj):
+    """Returns tooltip text of obj, its str and docstring"""
+    desc = short_str(obj)
+
+    if obj.__doc__:
+        # omit last '.'; blender adds an '.' after
+        desc += "\n\n" + str(obj.__doc__).rstrip(" .")
+
+    return desc
+
+
+def rna_member_description(path):
+    """Returns description of an RNA property or function from its metadata,
+    without calling its getter; None if path isn't an RNA member"""
+
+    steps = compile_path(path.strip())
+    if not steps or len(steps) < 2 or not steps[-1][1]:
+        return None
+
+    owner = evaluate(steps[-2][0])
+    if not isinstance(owner, bpy_struct_type()):
+        return None
+
+    name = steps[-1][2]
+    bl_rna = owner.bl_rna
+
+    prop = bl_rna.properties.get(name)
+    if prop is not None:
+        desc = prop.type
+        if prop.type in {'POINTER', 'COLLECTION'}:
+            desc += f" of {prop.fixed_type.identifier}"
+        elif rna_array_length(prop):
+            desc += f"[{rna_array_length(prop)}]"
+        if prop.is_readonly:
+            desc += ", readonly"
+
+    else:
+        prop = bl_rna.functions.get(name)
+        if prop is None:
+            return None
+        desc = "FUNCTION"
+
+    if prop.description:
+        # omit last '.'; blender adds an '.' after
+        desc += "\n\n" + prop.description.rstrip(" .")
+
+    return desc
+
+
+def short_str(obj, limit=DESCRIPTION_LENGTH):
+    """Returns str(obj) cut to limit characters,
+    builtin containers are summarized instead of fully stringified"""
+
+    if type(obj) in (list, tuple, dict, set, frozenset):
+        text = _SHORT_REPR.repr(obj)
+    else:
+        text = str(obj)
+
+    if len(text) > limit:
+        text = text[:limit] + "..."
+    return text
+
+
+def object_fingerprint(obj):
+    """Returns a cheap value that changes when members of obj change:
+    identity, type, member names, length and update tag"""
+    try:
+        # hashed, a renamed member keeps len(dir())
+        names = hash(tuple(dir(obj)))
+    except:
+        names = -1
+
+    try:
+        size = len(obj)
+    except:
+        size = -1
+
+    # bpy wrappers are recreated on every access, id() isn't stable
+    try:
+        ident = obj.as_pointer()
+    except:
+        ident = id(obj)
+
+    return ident, type(obj), names, size, _UPDATE_TAGS.get(ident, 0)
+
+
+def known_categories(tree, old, new):
+    """Returns {member name: category index} of tree categorized with
+    fingerprint old, reusable for fingerprint new; None if not the same object"""
+    if not isinstance(tree, CompactTree) or not isinstance(old, tuple) \
+            or old[:2] != new[:2]:
+        return None
+    return dict(zip(tree.names, tree.categories))
+
+
+def path_fingerprint(path):
+    if not path:
+        # root modules come from sys.path
+        return root_modules_key()
+    return object_fingerprint(evaluate(path))
+
+
+def isiterable(mod):
+    try:
+        # (str, byte) can be passed but bpy.app gets ignored
+        return iter(mod) and not isinstance(mod, str)
+    except:
+        return False
+
+
+class LazyView:
+    """Indexable view of the keys or values of a collection,
+    entries are stringified only around the accessed window"""
+
+    def __init__(self, source):
+        try:
+            if len(source):
+                source[0]
+        except:
+            # sets, generators etc.
+            source = list(source)
+
+        self.source = source
+        self.start = 0
+        self.window = []
+
+    def __len__(self):
+        return len(self.source)
+
+    def __iter__(self):
+        for value in self.source:
+            yield str(value)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            stop = max(start, stop)
+            self.fetch(start, stop)
+            window = self.window[start - self.start : stop - self.start]
+            return window[::step]
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("LazyView index out of range")
+        return self[key:key+1][0]
+
+    def fetch(self, start, stop):
+        """Stringifies entries from start to stop, plus a prefetch margin"""
+        if self.start <= start and stop <= self.start + len(self.window):
+            return
+
+        source = self.source
+        start = max(0, start - LAZY_PREFETCH)
+        stop = min(len(source), stop + LAZY_PREFETCH)
+
+        self.window = [str(source[i]) for i in range(start, stop)]
+        self.start = start
+
+    def enumerated(self):
+        return FilteredView(self, range(len(self)))
+
+
+def type_category(typ):
+    """Returns category index of values of type typ"""
+    try:
+        return _TYPE_CATEGORIES[typ]
+    except KeyError:
+        pass
+
+    # classified once per type by its repr
+    styp = str(typ)
+
+    if styp == "<class 'module'>":
+        cat = MODULES
+    elif styp.startswith("<class 'bpy_prop"):
+        cat = PROPERTIES
+    elif styp.startswith("<class 'bpy"):
+        cat = STRUCTS
+    elif styp == "<class 'builtin_function_or_method'>":
+        cat = METHODS
+    elif styp == "<class 'type'>":
+        cat = TYPES
+    else:
+        cat = ATTRIBUTES
+
+    _TYPE_CATEGORIES[typ] = cat
+    return cat
+
+
+def rna_array_length(prop):
+    """Returns total array length of an RNA property, 0 if not an array"""
+    dimensions = [d for d in getattr(prop, 'array_dimensions', ()) if d]
+    if len(dimensions) > 1:
+        length = 1
+        for d in dimensions:
+            length *= d
+        return length
+    return getattr(prop, 'array_length', 0)
+
+
+def rna_property_category(prop):
+    """Returns category index of an RNA property's value, mirroring
+    the types bpy returns for it"""
+
+    if prop.type == 'POINTER':
+        return STRUCTS
+    if prop.type == 'COLLECTION':
+        return PROPERTIES
+
+    length = rna_array_length(prop)
+    if not length:
+        return ATTRIBUTES
+
+    # only matrices are converted from multi dimensional arrays
+    dimensions = len([d for d in getattr(prop, 'array_dimensions', ()) if d])
+    if dimensions > 1 and prop.subtype != 'MATRIX':
+        return PROPERTIES
+
+    if prop.type == 'FLOAT' and length in _MATHUTILS_SUBTYPES.get(prop.subtype, ()):
+        return ATTRIBUTES   # mathutils object
+    return PROPERTIES       # bpy_prop_array
+
+
+def get_rna_categories(obj):
+    """Returns {member name: category index} of RNA properties and functions
+    of a bpy_struct instance, None for other objects"""
+
+    if not isinstance(obj, bpy_struct_type()):
+        return None
+
+    klass = type(obj)
+    try:
+        return _RNA_CATEGORIES[klass]
+    except KeyError:
+        pass
+
+    bl_rna = obj.bl_rna
+    categories = {func.identifier: STRUCTS for func in bl_rna.functions}   # bpy_func
+    for prop in bl_rna.properties:
+        categories[prop.identifier] = rna_property_category(prop)
+
+    _RNA_CATEGORIES[klass] = categories
+    return categories
+
+
+# following functions are taken from rlcompleter.py and modified
+
+def get_class_members(klass):
+    """Returns member names of klass and all its bases"""
+    try:
+        return _CLASS_MEMBERS[klass]
+    except (KeyError, TypeError):
+        pass
+
+    # dir(klass) walks the MRO once, dir() of each base would walk its rest again;
+    # __dict__ names add members hidden by a metaclass __dir__
+    members = set(dir(klass))
+    for base in getattr(klass, '__mro__', ()):
+        members.update(getattr(base, '__dict__', ()))
+    members = frozenset(members)
+
+    try:
+        _CLASS_MEMBERS[klass] = members
+    except TypeError:   # not weak referenceable
+        pass
+
+    return members
+
+
+def member_words(obj):
+    """Returns sorted member names of obj, including class members"""
+    words = set(dir(obj))
+    if hasattr(obj, '__class__'):
+        words.add('__class__')
+        words.update(get_class_members(obj.__class__))
+    return sorted(words)
+
+
+class CategorizeJob:
+    """Categorizes members of an object in time limited steps,
+    tree holds partial results while unfinished"""
+
+    def __init__(self, obj, known=None):
+        self.obj = obj
+        itm = val = None
+
+        if isiterable(obj):
+            keys = obj.keys() if hasattr(obj, 'keys') else None
+            if keys is not None \
+                and len(obj) == len(keys): # special check for <class 'bpy_prop_collection'>
+                itm = LazyView(list(keys))
+            else:
+                val = LazyView(obj)
+
+        self.tree = CompactTree(itm, val, obj)
+
+        self.words = member_words(obj)
+        self.index = 0
+        # RNA members are classified without calling their getters
+        self.rna = get_rna_categories(obj) or {}
+        # members categorized before, only added ones are classified
+        self.known = known or {}
+
+    @property
+    def done(self):
+        return self.index >= len(self.words)
+
+    def step(self, budget=None):
+        """Categorizes members until budget seconds are spent, None for no limit"""
+
+        obj = self.obj
+        words = self.words
+        tree = self.tree
+        rna = self.rna
+        known = self.known
+        deadline = None if budget is None else time.perf_counter() + budget
+
+        while self.index < len(words):
+            word = words[self.index]
+            self.index += 1
+
+            cat = rna.get(word)
+            if cat is None:
+                cat = known.get(word)
+            if cat is None:
+                try:
+                    cat = type_category(type(getattr(obj, word)))
+                except:
+                    cat = INACCESSIBLE
+
+            tree.add(cat, word)
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+
+def object_categories(obj):
+    job = CategorizeJob(obj)
+    job.step()
+    return job.tree
+    
+
+def global_categories(modules=True):
+
+    itm, val, mod, typ, props, struct, met, att, bug = [], [], [], [], [], [], [], [], []
+    if modules:
+        mod += root_modules()
+
+    for word, value in builtins.__dict__.items():
+        try:
+            cat = type_category(type(value))
+        except:
+            bug.append( word )
+            continue
+
+        if cat == TYPES:
+            typ.append( word )
+        elif cat == METHODS:
+            met.append( word )
+        else:
+            att.append( word )
+    
+    return CompactTree.from_categories((itm, val, mod, typ, props, struct, met, att, bug))
+
+
+class RootCategorizeJob:
+    """Categorizes builtins right away, root modules are added
+    once changed sys.path entries are scanned"""
+
+    def __init__(self):
+        self.tree = global_categories(modules=False)
+        self.words = sys.path
+        self.finished = False
+
+    @property
+    def index(self):
+        return sum(path in _ROOT_MODULES for path in self.words)
+
+    @property
+    def done(self):
+        return self.finished
+
+    def step(self, budget=None):
+        """Adds root modules if scanned, waits for the scan if budget is None"""
+        if scan_root_modules(wait=budget is None):
+            self.tree[MODULES].extend(root_modules())
+            self.finished = True
+
+
+def categorize_module(path):
+    
+    if not path:
+        return global_categories()
+
+    module = evaluate(path)
+
+    return object_categories(module)
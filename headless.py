@@ -0,0 +1,142 @@
+"""Dumps categorized trees of API paths as JSON lines, without the user interface
+
+Run inside Blender or with plain Python:
+    blender --background --python headless.py -- bpy.types mathutils --depth 1
+    python headless.py os.path json --limit 50
+"""
+
+import sys, os, json, argparse, itertools
+
+if __package__:
+    from . import core
+else:   # run as a script
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import core
+
+
+def categorized_tree(path, limit=None):
+    """Returns {category label: entries} of path, the empty path lists
+    root modules and builtins"""
+
+    tree = core.categorize_module(path)
+    return {label: list(itertools.islice(category, limit))
+            for (label, _), category in zip(core.CATEGORIES, tree)}
+
+
+def walk(paths, depth=0):
+    """Yields paths and their Modules and Types members down to depth levels"""
+
+    seen = set()
+    queue = [(path, 0) for path in paths]
+
+    while queue:
+        path, level = queue.pop(0)
+        if path in seen:
+            continue
+        seen.add(path)
+        yield path
+
+        if level >= depth or not path:
+            continue
+
+        tree = core.categorize_module(path)
+        for cat in (core.MODULES, core.TYPES):
+            for word in tree[cat]:
+                if not word.startswith('_'):
+                    queue.append((f"{path}.{word}", level + 1))
+
+
+def record(path, limit=None, descriptions=False):
+    """Returns the JSON record of path: its path, type and categories,
+    or the error evaluating it"""
+
+    result = {"path": path}
+    obj = core.evaluate(path) if path else None
+
+    if isinstance(obj, Exception):
+        result["error"] = f"{type(obj).__name__}: {obj}"
+        return result
+
+    if path:
+        result["type"] = str(type(obj))
+    result["categories"] = categorized_tree(path, limit)
+
+    if descriptions and path:
+        result["str"] = core.short_str(obj)
+        result["doc"] = str(obj.__doc__) if obj.__doc__ else ""
+        result["descriptions"] = member_descriptions(obj, result["categories"])
+
+    return result
+
+
+def member_descriptions(obj, categories):
+    """Returns {member name: tooltip text} of the members of obj"""
+
+    descriptions = {}
+    for label, words in categories.items():
+        if label in ("Items", "Values"):
+            continue
+        for word in words:
+            try:
+                desc = core.describe(getattr(obj, word))
+            except Exception:
+                continue
+            descriptions[word] = desc[:core.DESCRIPTION_LENGTH]
+
+    return descriptions
+
+
+def dump(paths, file=sys.stdout, depth=0, limit=None):
+    """Writes one JSON record per path"""
+    for path in walk(paths, depth):
+        file.write(json.dumps(record(path, limit)) + "\n")
+
+
+def serve(requests=sys.stdin, file=sys.stdout):
+    """Answers {"path", "limit"} requests read line by line with records
+    including descriptions, used by the add-on's worker processes"""
+
+    # modules printing on import would corrupt the responses
+    sys.stdout = sys.stderr
+
+    for line in requests:
+        request = json.loads(line)
+        try:
+            response = record(request["path"], request.get("limit"), descriptions=True)
+        except Exception as e:
+            response = {"path": request["path"], "error": f"{type(e).__name__}: {e}"}
+        file.write(json.dumps(response) + "\n")
+        file.flush()
+
+
+def main(argv=None):
+    if argv is None:
+        # blender passes script arguments after '--'
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog="headless.py", description="Dumps categorized API trees as JSON lines")
+    parser.add_argument('paths', nargs='*', default=[""],
+                        help="API paths, root modules and builtins if omitted")
+    parser.add_argument('--depth', type=int, default=0,
+                        help="levels of Modules and Types members to descend into")
+    parser.add_argument('--limit', type=int, default=None,
+                        help="most entries listed per category")
+    parser.add_argument('--output', '-o', help="file to write instead of stdout")
+    parser.add_argument('--serve', action='store_true',
+                        help="answer JSON requests from stdin, one per line")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve()
+        return
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(args.paths, file, args.depth, args.limit)
+    else:
+        dump(args.paths, sys.stdout, args.depth, args.limit)
+
+
+if __name__ == "__main__":
+    main()
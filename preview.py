@@ -0,0 +1,151 @@
+"""Numeric previews of bpy_prop_array and bpy_prop_collection data,
+read in bulk with foreach_get into NumPy arrays"""
+
+from .core import rna_array_length
+
+# RNA property type -> NumPy dtype foreach_get fills
+RNA_DTYPES = {'FLOAT': 'f4', 'INT': 'i4', 'BOOLEAN': '?'}
+HISTOGRAM_BINS = 10
+# most values binned, larger arrays are sampled by evenly strided rows
+HISTOGRAM_SAMPLE = 100_000
+# characters of the longest histogram bar
+HISTOGRAM_WIDTH = 40
+
+
+class NumericPreview:
+    """Shape, dtype, statistics and histogram of a numeric array"""
+    __slots__ = ('name', 'shape', 'dtype', 'minimum', 'maximum', 'mean',
+                 'counts', 'edges', 'sampled')
+
+    def __init__(self, np, name, data):
+        self.name = name
+        self.shape = data.shape
+        self.dtype = str(data.dtype)
+        self.counts = self.edges = None
+        self.sampled = False
+
+        if data.dtype.kind == 'b':
+            data = data.view('u1')
+
+        values = data.ravel()
+        finite = values.size and np.isfinite(values.min()) and np.isfinite(values.max())
+        if values.size and not finite:
+            # nan and inf are left out of the statistics
+            data = values = values[np.isfinite(values)]
+
+        if not values.size:
+            self.minimum = self.maximum = self.mean = None
+            return
+
+        self.minimum = values.min().item()
+        self.maximum = values.max().item()
+        self.mean = values.mean(dtype='f8').item()
+
+        step = -(values.size // -HISTOGRAM_SAMPLE)   # ceil div
+        sample = data[::step].ravel()
+        self.sampled = step > 1
+        counts, self.edges = np.histogram(
+            sample, HISTOGRAM_BINS, (self.minimum, self.maximum))
+        # scaled back to estimated counts of all values
+        self.counts = counts * (values.size / max(sample.size, 1))
+
+    def text(self):
+        """Returns statistics and histogram as lines of text"""
+        if self.mean is None:
+            return "empty"
+
+        lines = [f"min {self.minimum:.6g}   max {self.maximum:.6g}   mean {self.mean:.6g}"]
+        most = max(self.counts.max(), 1)
+        approx = "~" if self.sampled else ""
+        for count, edge in zip(self.counts, self.edges):
+            bar = "#" * round(HISTOGRAM_WIDTH * count / most)
+            lines.append(f"{edge:>12.4g}  {bar} {approx}{round(count)}")
+        return "\n".join(lines)
+
+
+def array_shape(obj):
+    """Returns shape of a possibly nested sequence and its first scalar"""
+    shape = []
+    while hasattr(obj, '__len__') and not isinstance(obj, str):
+        shape.append(len(obj))
+        if not len(obj):
+            return tuple(shape), None
+        obj = obj[0]
+    return tuple(shape), obj
+
+
+def scalar_dtype(value):
+    if isinstance(value, bool):
+        return '?'
+    if isinstance(value, int):
+        return 'i4'
+    if isinstance(value, float):
+        return 'f4'
+    return None
+
+
+def read_prop_array(np, obj):
+    """Returns the values of a bpy_prop_array, None if not numeric"""
+    shape, first = array_shape(obj)
+    dtype = scalar_dtype(first)
+    if dtype is None:
+        return None
+
+    data = np.empty(shape, dtype)
+    try:
+        obj.foreach_get(data.ravel())
+    except (AttributeError, TypeError, RuntimeError):
+        # no bulk access before blender 2.83
+        data[...] = obj
+    return data
+
+
+def read_collection(np, obj):
+    """Returns {attribute: values} of the numeric attributes of the items
+    of a bpy_prop_collection"""
+
+    count = len(obj)
+    if not count:
+        return {}
+
+    rna = getattr(obj[0], 'bl_rna', None)
+    if rna is None:
+        return {}
+
+    arrays = {}
+    for prop in rna.properties:
+        dtype = RNA_DTYPES.get(prop.type)
+        if dtype is None:
+            continue
+
+        length = rna_array_length(prop)
+        data = np.empty((count, length) if length else count, dtype)
+        try:
+            obj.foreach_get(prop.identifier, data.ravel())
+        except (TypeError, RuntimeError):
+            continue    # dynamic arrays, unsupported types
+        arrays[prop.identifier] = data
+
+    return arrays
+
+
+def numeric_previews(obj):
+    """Returns NumericPreviews of the numeric data of a bpy_prop_array or
+    bpy_prop_collection, empty for other objects or without NumPy"""
+
+    name = type(obj).__name__
+    if name != 'bpy_prop_array' and not name.startswith('bpy_prop_collection'):
+        return []
+
+    try:
+        import numpy as np
+    except ImportError:
+        return []
+
+    if name == 'bpy_prop_array':
+        arrays = {"values": read_prop_array(np, obj)}
+    else:
+        arrays = read_collection(np, obj)
+
+    return [NumericPreview(np, key, data) for key, data in arrays.items()
+            if data is not None]
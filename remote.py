@@ -0,0 +1,191 @@
+"""Categorizes modules in worker subprocesses, so heavy modules can be
+browsed without importing them into Blender"""
+
+import sys, os, json, subprocess, threading, functools, importlib.util, importlib.machinery
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .core import CATEGORIES, CompactTree, parent, compile_path
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "headless.py")
+# unclaimed results and object infos kept by a WorkerPool
+WORKER_RESULTS = 64
+
+
+def python_executable():
+    """Returns the Python interpreter to run workers with"""
+    bpy = sys.modules.get('bpy')
+    # older blender runs itself as sys.executable
+    if bpy is not None and bpy.app.version < (2, 91, 0):
+        return bpy.app.binary_path_python
+    return sys.executable
+
+
+@functools.lru_cache(maxsize=256)
+def is_pure_python(name):
+    """Returns whether top level module name and, for a package, all its
+    submodules are Python source, without importing it"""
+    if name in sys.builtin_module_names:
+        return False
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return False
+    origin = getattr(spec, 'origin', None)
+    if not origin or not origin.endswith('.py'):
+        return False
+
+    extensions = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+    for location in spec.submodule_search_locations or ():
+        for _, _, files in os.walk(location):
+            if any(file.endswith(extensions) for file in files):
+                return False
+    return True
+
+
+def is_remote_path(path):
+    """Returns whether path can be categorized by a worker, its root module
+    is pure Python and not imported in this process"""
+    steps = compile_path(path.strip()) if path else None
+    if not steps:
+        return False
+    root = steps[0][2]
+    return root not in sys.modules and is_pure_python(root)
+
+
+class Worker:
+    """Worker subprocess answering one request at a time"""
+
+    def __init__(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        self.process = subprocess.Popen(
+            [python_executable(), WORKER_SCRIPT, "--serve"], env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8')
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    def request(self, path):
+        self.process.stdin.write(json.dumps({"path": path}) + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("Worker exited")
+        return json.loads(line)
+
+    def close(self):
+        self.process.kill()
+        self.process.wait()
+
+
+class WorkerPool:
+    """Worker subprocesses categorizing paths in parallel,
+    each pool thread talks to its own worker"""
+
+    def __init__(self, size):
+        self.size = size
+        self.executor = ThreadPoolExecutor(size, thread_name_prefix="API Browser worker")
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.workers = []
+        self.futures = OrderedDict()    # path -> Future of the record
+        self.infos = OrderedDict()      # path -> record without categories
+
+    def submit(self, path):
+        """Starts categorizing path unless it already is"""
+        future = self.futures.get(path)
+        if future is None:
+            future = self.futures[path] = self.executor.submit(self.categorize, path)
+            while len(self.futures) > WORKER_RESULTS:
+                self.futures.popitem(last=False)[1].cancel()
+        return future
+
+    def collect(self, path, wait=False):
+        """Returns the record of path once finished, None while running"""
+        future = self.submit(path)
+        if not wait and not future.done():
+            return None
+        self.futures.pop(path, None)
+        result = future.result()
+
+        info = dict(result)
+        info.pop("categories", None)
+        self.infos[path] = info
+        while len(self.infos) > WORKER_RESULTS:
+            self.infos.popitem(last=False)
+        return result
+
+    def categorize(self, path):
+        """Requests path from the worker of the current pool thread"""
+        worker = getattr(self.local, 'worker', None)
+        if worker is None or not worker.alive:
+            worker = self.local.worker = Worker()
+            with self.lock:
+                self.workers.append(worker)
+        try:
+            return worker.request(path)
+        except:
+            worker.close()
+            raise
+
+    def description(self, path):
+        """Returns tooltip text of a collected path or its members, None if unknown"""
+        info = self.infos.get(path)
+        if info is not None and "error" not in info:
+            desc = info["str"]
+            if info["doc"]:
+                desc += "\n\n" + info["doc"].rstrip(" .")
+            return desc
+
+        steps = compile_path(path.strip())
+        info = self.infos.get(parent(path))
+        if info is None or not steps or not steps[-1][1]:
+            return None
+        return info.get("descriptions", {}).get(steps[-1][2])
+
+    def shutdown(self):
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        with self.lock:
+            for worker in self.workers:
+                worker.close()
+            self.workers.clear()
+        self.executor.shutdown(wait=False)
+
+
+class RemoteJob:
+    """Categorizes path in a worker, never in process; the tree keeps
+    the worker's error if it can't"""
+
+    def __init__(self, pool, path):
+        self.pool = pool
+        self.path = path
+        self.tree = CompactTree()
+        self.finished = False
+        self.index = 0
+        self.words = (path,)
+        pool.submit(path)
+
+    @property
+    def done(self):
+        return self.finished
+
+    def step(self, budget=None):
+        """Adds the worker's result once finished, waits for it if budget is None"""
+        try:
+            result = self.pool.collect(self.path, wait=budget is None)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        if result is None:
+            return
+
+        if "error" in result:
+            self.tree.error = result["error"]
+        else:
+            for category, (label, _) in zip(self.tree, CATEGORIES):
+                category.extend(result["categories"][label])
+        self.index = 1
+        self.finished = True
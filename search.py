@@ -0,0 +1,346 @@
+"""Name and docstring search over the whole API"""
+
+import re, builtins, sys, time, itertools, bisect, math, heapq
+from array import array
+from types import ModuleType
+from collections import deque, Counter
+
+from .core import MODULES, INACCESSIBLE, evaluate, type_category, \
+    get_class_members, bpy_struct_type
+
+
+# levels of modules/classes crawled below the root modules
+SYMBOL_INDEX_DEPTH = 4
+SEARCH_LIMIT = 200
+# seconds between lookup table rebuilds while still crawling
+LOOKUP_INTERVAL = 0.5
+
+_DOC_TOKEN = re.compile(r"[a-z0-9]{2,}")
+# index terms an unfinished last query word expands to
+DOC_PREFIX_TERMS = 50
+
+
+class SymbolIndex:
+    """Names and full paths of symbols reachable from builtins and the
+    imported root modules, crawled in time limited steps"""
+
+    def __init__(self, max_depth=SYMBOL_INDEX_DEPTH, crawl=True):
+        self.names = []
+        self.paths = []
+        self.categories = array('B')
+        self.max_depth = max_depth
+
+        self.queue = deque()    # (path, obj, depth) to crawl
+        self.seen = {}          # id -> obj, objects are kept alive while crawling
+        self.current = None     # [path, obj, depth, words, index]
+
+        # lookup tables, rebuilt when names grow
+        self.indexed = -1
+        self.lookup_time = 0.0      # perf_counter() of the last rebuild
+        self.sorted_names = []
+        self.sorted_ids = array('I')
+        self.joined = ""
+        self.offsets = array('I')
+
+        if not crawl:
+            return
+
+        self.queue.append(("", builtins, 0))
+        self.seen[id(builtins)] = builtins
+
+        # importing every root module would be slow and has side effects,
+        # imported ones are listed without waiting for sys.path to be scanned
+        for name in sorted(sys.modules):
+            module = sys.modules.get(name)
+            if '.' in name or name == '__main__':
+                continue
+            if module is not None and id(module) not in self.seen:
+                self.add(name, name, MODULES)
+                self.seen[id(module)] = module
+                self.queue.append((name, module, 1))
+
+    @property
+    def done(self):
+        return self.current is None and not self.queue
+
+    def add(self, name, path, category):
+        self.names.append(name)
+        self.paths.append(path)
+        self.categories.append(category)
+
+    def step(self, budget=None):
+        """Crawls members until budget seconds are spent, None for no limit"""
+
+        deadline = None if budget is None else time.perf_counter() + budget
+
+        while not self.done:
+            if self.current is None:
+                path, obj, depth = self.queue.popleft()
+                self.current = [path, obj, depth, symbol_members(obj), 0]
+
+            current = self.current
+            path, obj, depth, words, index = current
+            if index >= len(words):
+                self.current = None
+                continue
+            current[4] += 1
+
+            word = words[index]
+            sub_path = f"{path}.{word}" if path else word
+
+            try:
+                value = getattr(obj, word)
+                cat = type_category(type(value))
+            except:
+                self.add(word, sub_path, INACCESSIBLE)
+                continue
+
+            self.add(word, sub_path, cat)
+
+            # bpy.types classes have bpy metaclasses, checked by isinstance;
+            # bpy.ops submodules are neither, their members are the operators
+            crawl = isinstance(value, (type, ModuleType)) or path == "bpy.ops"
+            if crawl and depth < self.max_depth \
+                    and not word.startswith('_') and id(value) not in self.seen:
+                self.seen[id(value)] = value
+                self.queue.append((sub_path, value, depth + 1))
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        if self.done:
+            self.seen.clear()
+
+    @classmethod
+    def from_tables(cls, names, paths, categories, joined, offsets, sorted_ids):
+        """Returns a finished index over prebuilt lookup tables"""
+        index = cls(crawl=False)
+        index.names = names
+        index.paths = paths
+        index.categories = categories
+        index.joined = joined
+        index.offsets = offsets
+        index.sorted_ids = sorted_ids
+        index.sorted_names = JoinedNames(joined, offsets, sorted_ids)
+        index.indexed = len(names)
+        return index
+
+    def update_lookup(self):
+        """Rebuilds lookup tables if symbols were added, at most once
+        per LOOKUP_INTERVAL while crawling"""
+        if self.indexed == len(self.names):
+            return
+        now = time.perf_counter()
+        if not self.done and now - self.lookup_time < LOOKUP_INTERVAL:
+            return
+        self.lookup_time = now
+        self.indexed = len(self.names)
+
+        lower = [name.lower() for name in self.names]
+
+        order = sorted(range(len(lower)), key=lower.__getitem__)
+        self.sorted_names = [lower[i] for i in order]
+        self.sorted_ids = array('I', order)
+
+        # one string to search substrings in C, offsets map matches back to symbols
+        self.joined = "\n".join(lower)
+        self.offsets = array('I', itertools.accumulate(
+            itertools.chain((0,), (len(name) + 1 for name in lower[:-1]))))
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Returns paths of symbols named like query, prefix matches first"""
+
+        query = query.strip().lower()
+        if not query or "\n" in query:
+            return []
+
+        self.update_lookup()
+        found = []
+        found_ids = set()
+
+        # prefix matches
+        start = bisect.bisect_left(self.sorted_names, query)
+        for pos in range(start, len(self.sorted_names)):
+            if len(found) >= limit or not self.sorted_names[pos].startswith(query):
+                break
+            idx = self.sorted_ids[pos]
+            found.append(idx)
+            found_ids.add(idx)
+
+        # substring matches
+        joined, offsets = self.joined, self.offsets
+        pos = joined.find(query)
+        while pos != -1 and len(found) < limit:
+            idx = bisect.bisect_right(offsets, pos) - 1
+            if idx not in found_ids:
+                found.append(idx)
+                found_ids.add(idx)
+            # continue after this name
+            if idx + 1 >= len(offsets):
+                break
+            pos = joined.find(query, offsets[idx + 1])
+
+        return [self.paths[idx] for idx in found]
+
+
+class JoinedNames:
+    """Sorted lowercase names sliced out of SymbolIndex.joined"""
+
+    def __init__(self, joined, offsets, sorted_ids):
+        self.joined = joined
+        self.offsets = offsets
+        self.sorted_ids = sorted_ids
+
+    def __len__(self):
+        return len(self.sorted_ids)
+
+    def __getitem__(self, pos):
+        idx = self.sorted_ids[pos]
+        start = self.offsets[idx]
+        end = self.offsets[idx + 1] - 1 if idx + 1 < len(self.offsets) else len(self.joined)
+        return self.joined[start:end]
+
+
+def symbol_members(obj):
+    """Returns member names of obj to index, classes only list their own"""
+
+    words = dir(obj)
+    if isinstance(obj, type):
+        inherited = set()
+        for base in obj.__bases__:
+            inherited |= get_class_members(base)
+        words = [word for word in words if word not in inherited]
+
+    return [word for word in words if not word.startswith('__')]
+
+
+class DocIndex:
+    """Inverted index of docstrings and RNA descriptions of the symbols
+    of a SymbolIndex, built in time limited steps"""
+
+    def __init__(self, symbols):
+        self.symbols = symbols
+        self.position = 0       # next symbol to read
+        self.documented = {}    # id -> obj, aliases of an object are read once
+
+        self.paths = []
+        self.lengths = array('H')
+        # term -> (document ids, term counts), ids are ascending
+        self.postings = {}
+        self.terms = None       # sorted terms, rebuilt after adding documents
+
+    @property
+    def done(self):
+        return self.symbols.done and self.position >= len(self.symbols.paths)
+
+    def add(self, path, text):
+        tokens = _DOC_TOKEN.findall(text.lower())
+        if not tokens:
+            return
+
+        doc_id = len(self.paths)
+        self.paths.append(path)
+        self.lengths.append(min(len(tokens), 0xFFFF))
+
+        for term, count in Counter(tokens).items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = (array('I'), array('B'))
+            posting[0].append(doc_id)
+            posting[1].append(min(count, 0xFF))
+
+        self.terms = None
+
+    def step(self, budget=None):
+        """Reads docs of symbols until budget seconds are spent, None for no limit"""
+
+        deadline = None if budget is None else time.perf_counter() + budget
+        paths = self.symbols.paths
+
+        while self.position < len(paths):
+            path = paths[self.position]
+            self.position += 1
+
+            obj = evaluate(path)
+            if id(obj) in self.documented:
+                continue
+            self.documented[id(obj)] = obj
+
+            if isinstance(obj, (type, ModuleType)) or callable(obj):
+                doc = getattr(obj, '__doc__', None)
+                if isinstance(doc, str):
+                    self.add(path, doc)
+
+            rna = getattr(obj, 'bl_rna', None) if isinstance(obj, type) else None
+            if isinstance(rna, bpy_struct_type()):
+                self.add_rna(path, rna)
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        if self.done:
+            self.documented.clear()
+
+    def add_rna(self, path, rna):
+        """Adds descriptions of properties and functions a struct doesn't inherit"""
+        base = rna.base
+        inherited = set(base.properties.keys()) | set(base.functions.keys()) if base else ()
+
+        for member in itertools.chain(rna.properties, rna.functions):
+            if member.identifier not in inherited:
+                self.add(f"{path}.{member.identifier}", f"{member.name} {member.description}")
+
+    def expand(self, prefix):
+        """Returns index terms starting with prefix"""
+        if self.terms is None:
+            self.terms = sorted(self.postings)
+
+        terms = []
+        start = bisect.bisect_left(self.terms, prefix)
+        for term in itertools.islice(self.terms, start, start + DOC_PREFIX_TERMS):
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Returns paths of documents containing all query words, best first,
+        the last word also matches as a prefix"""
+
+        words = _DOC_TOKEN.findall(query.lower())
+        if not words:
+            return []
+
+        groups = [[word] for word in words[:-1]] + [self.expand(words[-1])]
+        # rarest words first, so candidates shrink fast
+        groups.sort(key=lambda group: sum(len(self.postings.get(t, ((),))[0]) for t in group))
+
+        count = len(self.paths)
+        scores = None
+
+        for group in groups:
+            group_scores = {}
+            for term in group:
+                ids, counts = self.postings.get(term, ((), ()))
+                if not ids:
+                    continue
+                idf = math.log(1 + count / len(ids))
+                for doc, tf in zip(ids, counts):
+                    if scores is None or doc in scores:
+                        score = tf * idf
+                        if score > group_scores.get(doc, 0):
+                            group_scores[doc] = score
+
+            if scores is None:
+                scores = group_scores
+            else:
+                scores = {doc: score + group_scores[doc]
+                          for doc, score in scores.items() if doc in group_scores}
+            if not scores:
+                return []
+
+        lengths = self.lengths
+        best = heapq.nlargest(limit, scores.items(),
+                              key=lambda item: item[1] / math.sqrt(lengths[item[0]]))
+        return [self.paths[doc] for doc, _ in best]
+
@@ -0,0 +1,224 @@
+"""Memory mapped snapshots of the symbol index and categorized trees"""
+
+import sys, os, mmap, struct, zlib, itertools
+from array import array
+from types import ModuleType
+
+from .core import CATEGORIES, CompactTree, member_words
+from .search import SymbolIndex
+
+
+SNAPSHOT_MAGIC = b'APIB'
+SNAPSHOT_FORMAT = 1
+
+# Layout, little endian u32 unless noted:
+#   magic, format
+#   string count, offsets[count + 1], utf-8 blob (pad 4)
+#   symbol count, name ids, path ids, categories (u8, pad 4)
+#   joined byte length, joined utf-8 (pad 4), joined offsets, sorted ids
+#   tree count, (path id, members crc, data offset) per tree
+#   tree data: per category, count and string ids
+
+
+def members_crc(obj):
+    """Returns a process independent checksum of the member names of obj"""
+    return zlib.crc32("\n".join(member_words(obj)).encode())
+
+
+def is_static(obj):
+    """Returns whether obj belongs to the API structure rather than data"""
+    return isinstance(obj, (type, ModuleType))
+
+
+def _to_le(arr):
+    if sys.byteorder == 'big':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+class StringTable:
+    """Strings of a snapshot, decoded on access"""
+
+    def __init__(self, buffer, offsets, start):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.start = start
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self)
+        start = self.start + self.offsets[idx]
+        end = self.start + self.offsets[idx + 1]
+        return self.buffer[start:end].decode('utf-8')
+
+
+class IdStrings:
+    """Strings of a StringTable selected by an id array"""
+
+    def __init__(self, table, ids):
+        self.table = table
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, idx):
+        return self.table[self.ids[idx]]
+
+
+class _Reader:
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.pos = 0
+
+    def u32(self):
+        value, = struct.unpack_from('<I', self.buffer, self.pos)
+        self.pos += 4
+        return value
+
+    def array(self, typecode, count):
+        arr = array(typecode)
+        size = arr.itemsize * count
+        arr.frombytes(self.buffer[self.pos:self.pos + size])
+        if sys.byteorder == 'big':
+            arr.byteswap()
+        self.pos += size
+        return arr
+
+    def skip(self, size):
+        start = self.pos
+        self.pos += size
+        return start
+
+    def align(self):
+        self.pos += -self.pos % 4
+
+
+class Snapshot:
+    """Memory mapped snapshot of the symbol index and categorized trees"""
+
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        reader = _Reader(self.buffer)
+        if self.buffer[:4] != SNAPSHOT_MAGIC:
+            raise ValueError("Not an API snapshot")
+        reader.skip(4)
+        if reader.u32() != SNAPSHOT_FORMAT:
+            raise ValueError("Unsupported snapshot format")
+
+        count = reader.u32()
+        offsets = reader.array('I', count + 1)
+        self.strings = StringTable(self.buffer, offsets, reader.skip(offsets[-1]))
+        reader.align()
+
+        count = reader.u32()
+        self.name_ids = reader.array('I', count)
+        self.path_ids = reader.array('I', count)
+        self.categories = reader.array('B', count)
+        reader.align()
+
+        size = reader.u32()
+        self.joined = self.buffer[reader.skip(size):reader.pos].decode('utf-8')
+        reader.align()
+        self.offsets = reader.array('I', count)
+        self.sorted_ids = reader.array('I', count)
+
+        # path -> (members crc, data offset)
+        self.trees = {}
+        for _ in range(reader.u32()):
+            path_id, crc, offset = reader.u32(), reader.u32(), reader.u32()
+            self.trees[self.strings[path_id]] = (crc, offset)
+
+    def symbol_index(self):
+        return SymbolIndex.from_tables(
+            IdStrings(self.strings, self.name_ids),
+            IdStrings(self.strings, self.path_ids),
+            self.categories, self.joined, self.offsets, self.sorted_ids)
+
+    def tree(self, path):
+        """Returns (members crc, tree) of path, None if not in snapshot"""
+        if path not in self.trees:
+            return None
+
+        crc, offset = self.trees[path]
+        reader = _Reader(self.buffer)
+        reader.pos = offset
+        strings = self.strings
+
+        tree = []
+        for _ in CATEGORIES:
+            ids = reader.array('I', reader.u32())
+            tree.append([strings[i] for i in ids])
+
+        return crc, CompactTree.from_categories(tree)
+
+    def close(self):
+        self.buffer.close()
+
+
+def write_snapshot(filepath, index, trees):
+    """Writes the finished SymbolIndex and {path: (members crc, tree)} to filepath"""
+
+    string_ids = {}
+    def string_id(string):
+        idx = string_ids.get(string)
+        if idx is None:
+            idx = string_ids[string] = len(string_ids)
+        return idx
+
+    name_ids = array('I', (string_id(name) for name in index.names))
+    path_ids = array('I', (string_id(path) for path in index.paths))
+    tree_items = [(string_id(path), crc, [array('I', (string_id(name) for name in cat))
+                                          for cat in tree])
+                  for path, (crc, tree) in trees.items()]
+
+    blobs = [string.encode('utf-8') for string in string_ids]
+    offsets = array('I', itertools.accumulate(
+        itertools.chain((0,), (len(blob) for blob in blobs))))
+
+    index.update_lookup()
+    joined = index.joined.encode('utf-8')
+
+    def pad(size):
+        return b'\0' * (-size % 4)
+
+    chunks = [SNAPSHOT_MAGIC, struct.pack('<I', SNAPSHOT_FORMAT)]
+    chunks += [struct.pack('<I', len(blobs)), _to_le(offsets)]
+    chunks += blobs + [pad(offsets[-1])]
+    chunks += [struct.pack('<I', len(name_ids)), _to_le(name_ids), _to_le(path_ids),
+               index.categories.tobytes(), pad(len(index.categories))]
+    chunks += [struct.pack('<I', len(joined)), joined, pad(len(joined)),
+               _to_le(array('I', index.offsets)), _to_le(array('I', index.sorted_ids))]
+
+    # tree data follows the tree table
+    data_offset = sum(len(chunk) for chunk in chunks) + 4 + 12 * len(tree_items)
+    table, data = [struct.pack('<I', len(tree_items))], []
+    for path_id, crc, cats in tree_items:
+        table.append(struct.pack('<III', path_id, crc, data_offset))
+        for ids in cats:
+            data += [struct.pack('<I', len(ids)), _to_le(ids)]
+            data_offset += 4 + 4 * len(ids)
+
+    temp = filepath + ".tmp"
+    with open(temp, 'wb') as file:
+        file.write(b''.join(chunks + table + data))
+    os.replace(temp, filepath)
+
+
+def diff_symbols(old, new):
+    """Returns (added, removed, changed) entries between two {path: category} dicts"""
+
+    added = [(path, None, new[path]) for path in sorted(new.keys() - old.keys())]
+    removed = [(path, old[path], None) for path in sorted(old.keys() - new.keys())]
+    changed = [(path, old[path], new[path]) for path in sorted(old.keys() & new.keys())
+               if old[path] != new[path]]
+
+    return added, removed, changed
+